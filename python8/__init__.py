@@ -3,27 +3,33 @@ from importlib import import_module
 from python8.internal import constants
 from ._version import __version__
 
+# Core modules only depend on the standard library (and PyYAML), but are still loaded on first access
+_CORE_MODULES = [
+    "aio_files",
+    "checks",
+    "crypto",
+    "dictionaries",
+    "enums",
+    "files",
+    "general",
+    "json_backend",
+    "logs",
+    "objects",
+    "random",
+    "selector",
+    "serializers",
+    "sorting",
+    "sqlite_dict",
+    "time",
+    "uuid",
+    "yaml",
+]
+
 __all__ = [
     "__version__",
-].extend(constants.MODULES)
-
-# Load core elements
-from python8.core import (
-    checks as checks,
-    crypto as crypto,
-    dictionaries as dictionaries,
-    enums as enums,
-    files as files,
-    general as general,
-    logs as logs,
-    objects as objects,
-    random as random,
-    selector as selector,
-    sorting as sorting,
-    time as time,
-    uuid as uuid,
-    yaml as yaml,
-)
+    *_CORE_MODULES,
+    *constants.MODULES,
+]
 
 
 # Attempt to load each subpackage, but fail gracefully if it cannot be loaded
@@ -34,10 +40,20 @@ def _try_load_subpkg(name):
         return None
 
 
-config = _try_load_subpkg(constants.CONFIG_MODULE)
-conversions = _try_load_subpkg(constants.CONVERSIONS_MODULE)
-database = _try_load_subpkg(constants.DATABASE_MODULE)
-rest_api = _try_load_subpkg(constants.REST_API_MODULE)
-security = _try_load_subpkg(constants.SECURITY_MODULE)
-system = _try_load_subpkg(constants.SYSTEM_MODULE)
-web = _try_load_subpkg(constants.WEB_MODULE)
+def __getattr__(name):
+    # Lazily load core modules and subpackages on first access (PEP 562),
+    # so importing python8 does not pull in optional dependencies (SQLAlchemy, Flask, pydantic, psutil, etc.)
+    if name in _CORE_MODULES:
+        module = import_module(f"{__name__}.core.{name}")
+    elif name in constants.MODULES:
+        module = _try_load_subpkg(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the result so __getattr__ is only hit once per name
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
@@ -0,0 +1,86 @@
+import argparse
+import json
+import platform
+import timeit
+from typing import Callable, List
+
+from python8 import __version__
+
+
+def environment() -> dict:
+    """
+    Describe the environment a benchmark was run in, so reports from different releases can be compared.
+    :return: Dictionary of version and platform details
+    :rtype: dict
+    """
+    return {
+        "python8_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def time_call(func: Callable, number: int = 1, repeat: int = 5) -> float:
+    """
+    Time a callable, returning the best average time per call across several repeats.
+    :param func: Callable to time (takes no arguments)
+    :type func: Callable
+    :param number: Number of calls per repeat
+    :type number: int
+    :param repeat: Number of repeats
+    :type repeat: int
+    :return: Seconds per call
+    :rtype: float
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def build_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Build an argument parser with the options shared by every benchmark.
+    :param description: Description of the benchmark
+    :type description: str
+    :return: Argument parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats per measurement")
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON report to this file")
+    return parser
+
+
+def print_results(results: List[dict]) -> None:
+    """
+    Print a list of result rows as an aligned table.
+    :param results: Rows to print (all with the same keys)
+    :type results: List[dict]
+    :return: None
+    :rtype: None
+    """
+    if not results:
+        return
+    columns = list(results[0].keys())
+    widths = {c: max(len(c), *(len(_format(r[c])) for r in results)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for r in results:
+        print("  ".join(_format(r[c]).ljust(widths[c]) for c in columns))
+
+
+def save_report(report: dict, file_path: str) -> None:
+    """
+    Write a benchmark report to a JSON file.
+    :param report: Report to save
+    :type report: dict
+    :param file_path: Path to the JSON file
+    :type file_path: str
+    :return: None
+    :rtype: None
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
@@ -0,0 +1,97 @@
+"""
+Benchmark reading and writing many small files with python8.core.aio_files against the synchronous functions.
+
+Usage:
+    python -m python8.bench.aio_files [--files N] [--size-kb N] [--workers 4,16,32] [--repeat N] [--output report.json]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import aio_files, files
+
+
+def run(file_count: int = 2000, size_kb: int = 4, workers: List[int] = None, repeat: int = 3,
+        directory: str = None) -> dict:
+    """
+    Time writing and reading many small files sequentially, and concurrently with different pool sizes.
+    :param file_count: Number of files
+    :type file_count: int
+    :param size_kb: Size of each file, in KiB
+    :type size_kb: int
+    :param workers: Thread pool sizes to try
+    :type workers: List[int]
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :param directory: (Optional) Directory to create the test files in (defaults to the system temp directory)
+    :type directory: str
+    :return: Report dictionary
+    :rtype: dict
+    """
+    workers = workers or [4, 16, 32]
+    text = "x" * (size_kb * 1024)
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        paths = [os.path.join(folder, f"{i}.txt") for i in range(file_count)]
+        texts = {path: text for path in paths}
+
+        def _sync_write():
+            for path in paths:
+                files.write_to_file(text=text, filename=path)
+
+        def _sync_read():
+            return [files.read_from_file(path) for path in paths]
+
+        cases = [("sync", None, _sync_write, _sync_read)]
+        executors = []
+        for worker_count in workers:
+            executor = ThreadPoolExecutor(max_workers=worker_count)
+            executors.append(executor)
+            cases.append((
+                "aio",
+                worker_count,
+                lambda executor=executor: asyncio.run(aio_files.gather_write(texts, executor=executor)),
+                lambda executor=executor: asyncio.run(aio_files.gather_read(paths, executor=executor)),
+            ))
+
+        for name, worker_count, write, read in cases:
+            write_seconds = time_call(write, number=1, repeat=repeat)
+            read_seconds = time_call(read, number=1, repeat=repeat)
+            results.append({
+                "case": name,
+                "workers": worker_count or 1,
+                "files": file_count,
+                "write_files_per_second": file_count / write_seconds,
+                "read_files_per_second": file_count / read_seconds,
+            })
+
+        for executor in executors:
+            executor.shutdown()
+
+    return {**environment(), "benchmark": "aio_files", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark asyncio file I/O on many small files")
+    parser.add_argument("--files", type=int, default=2000, help="Number of files")
+    parser.add_argument("--size-kb", type=int, default=4, help="Size of each file, in KiB")
+    parser.add_argument("--workers", type=str, default="4,16,32", help="Comma-separated thread pool sizes")
+    parser.add_argument("--directory", type=str, default=None, help="Directory to create the test files in")
+    options = parser.parse_args(args)
+
+    report = run(file_count=options.files, size_kb=options.size_kb,
+                 workers=[int(w) for w in options.workers.split(",")], repeat=options.repeat,
+                 directory=options.directory)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
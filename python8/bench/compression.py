@@ -0,0 +1,130 @@
+"""
+Benchmark the compression codecs supported by python8.core.files on a large JSON artifact: size versus speed.
+
+Usage:
+    python -m python8.bench.compression [--records N] [--levels gzip=1,6,9] [--repeat N] [--output report.json]
+"""
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import dictionaries, files
+from python8.core.files import Compression
+
+# Levels tried for each codec by default (fastest, default, smallest)
+DEFAULT_LEVELS = {
+    Compression.GZIP: [1, 6, 9],
+    Compression.BZ2: [1, 9],
+    Compression.XZ: [0, 6],
+    Compression.ZSTD: [1, 3, 19],
+}
+
+
+def _payload(record_count: int) -> dict:
+    return {
+        "results": [
+            {
+                "id": i,
+                "name": f"Example Record {i}",
+                "email": f"user{i}@example.com",
+                "active": i % 3 != 0,
+                "score": (i * 7919) % 1000 / 10,
+                "tags": ["alpha", "beta", "gamma"][:i % 4],
+                "address": {"street": f"{i} Main St", "city": "Springfield", "zip": f"{10000 + i % 90000}"},
+            }
+            for i in range(record_count)
+        ]
+    }
+
+
+def _zstd_available() -> bool:
+    try:
+        from compression import zstd  # noqa: F401
+        return True
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def run(record_count: int = 50000, levels: Dict[Compression, List[int]] = None, repeat: int = 3,
+        directory: str = None) -> dict:
+    """
+    Time saving and loading a JSON artifact with each codec and level, and compare the file sizes.
+    :param record_count: Number of records in the JSON artifact
+    :type record_count: int
+    :param levels: (Optional) Compression levels to try for each codec (codecs that are not installed are skipped)
+    :type levels: Dict[Compression, List[int]]
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :param directory: (Optional) Directory to write the test files in (defaults to the system temp directory)
+    :type directory: str
+    :return: Report dictionary
+    :rtype: dict
+    """
+    levels = levels or DEFAULT_LEVELS
+    if not _zstd_available():
+        levels = {codec: codec_levels for codec, codec_levels in levels.items() if codec != Compression.ZSTD}
+    extensions = {codec: extension for extension, codec in files.COMPRESSION_EXTENSIONS.items()}
+    payload = _payload(record_count=record_count)
+
+    cases = [("none", None, "")]
+    for codec, codec_levels in levels.items():
+        cases.extend((codec.value, level, extensions[codec]) for level in codec_levels)
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        uncompressed_size = None
+        for name, level, extension in cases:
+            file_path = os.path.join(folder, f"artifact.json{extension}")
+            save_seconds = time_call(lambda: dictionaries.save_dict_to_file(file_path=file_path, dictionary=payload,
+                                                                            indent=None, compression_level=level),
+                                     number=1, repeat=repeat)
+            load_seconds = time_call(lambda: dictionaries.load_dict_from_file(file_path=file_path), number=1,
+                                     repeat=repeat)
+            size = os.path.getsize(file_path)
+            uncompressed_size = uncompressed_size or size
+            results.append({
+                "codec": name,
+                "level": level if level is not None else "-",
+                "bytes": size,
+                "ratio": uncompressed_size / size,
+                "save_ms": save_seconds * 1000,
+                "load_ms": load_seconds * 1000,
+            })
+
+    return {**environment(), "benchmark": "compression", "results": results}
+
+
+def _parse_levels(option: str) -> Dict[Compression, List[int]]:
+    levels = {}
+    for item in option.split(";"):
+        codec, _, values = item.partition("=")
+        levels[Compression(codec.strip())] = [int(value) for value in values.split(",")]
+    return levels
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark compressed file I/O: size versus speed")
+    parser.add_argument("--records", type=int, default=50000, help="Number of records in the JSON artifact")
+    parser.add_argument("--levels", type=str, default=None,
+                        help="Codecs and levels to try, e.g. 'gzip=1,6,9;xz=0,6' (default: every installed codec)")
+    parser.add_argument("--directory", type=str, default=None, help="Directory to write the test files in")
+    options = parser.parse_args(args)
+
+    report = run(record_count=options.records,
+                 levels=_parse_levels(options.levels) if options.levels else None,
+                 repeat=options.repeat, directory=options.directory)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Benchmark core.files.copy_file on a large file, against the previous read-then-write approach and shutil.
+
+Usage:
+    python -m python8.bench.copy [--size-mb 1024] [--repeat N] [--include-legacy] [--directory DIR] [--output report.json]
+"""
+import os
+import shutil
+import sys
+import tempfile
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import files
+
+
+def _make_file(file_path: str, size_mb: int) -> None:
+    # ASCII content, so the legacy text-mode copy can also read it
+    block = os.urandom(512 * 1024).hex().encode('ascii')
+    with open(file_path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def _legacy_copy(filename: str, new_filename: str) -> None:
+    # Previous copy_file implementation: read the whole file as text, then write it back
+    text = files.read_from_file(filename)
+    files.write_to_file(text=text, filename=new_filename)
+
+
+def _buffered_copy(filename: str, new_filename: str) -> None:
+    with open(filename, 'rb') as source, open(new_filename, 'wb') as destination:
+        files.copy_file_object(source=source, destination=destination)
+
+
+def run(size_mb: int = 1024, repeat: int = 3, include_legacy: bool = False, directory: str = None) -> dict:
+    """
+    Time copying a file of the given size with each copy strategy.
+    :param size_mb: Size of the test file, in MiB
+    :type size_mb: int
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :param include_legacy: Also time the previous read-then-write implementation (holds the whole file in memory)
+    :type include_legacy: bool
+    :param directory: (Optional) Directory to create the test files in (defaults to the system temp directory)
+    :type directory: str
+    :return: Report dictionary
+    :rtype: dict
+    """
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        source = os.path.join(folder, "source.bin")
+        destination = os.path.join(folder, "destination.bin")
+        _make_file(file_path=source, size_mb=size_mb)
+
+        cases = {
+            "copy_file (zero-copy)": lambda: files.copy_file(source, destination),
+            "copy_file_object (buffered)": lambda: _buffered_copy(source, destination),
+            "shutil.copyfile": lambda: shutil.copyfile(source, destination),
+        }
+        if include_legacy:
+            cases["legacy read/write"] = lambda: _legacy_copy(source, destination)
+
+        results = []
+        for name, func in cases.items():
+            seconds = time_call(func, number=1, repeat=repeat)
+            results.append({
+                "case": name,
+                "size_mb": size_mb,
+                "seconds": seconds,
+                "mb_per_second": size_mb / seconds,
+            })
+
+    return {**environment(), "benchmark": "copy", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark copying a large file")
+    parser.add_argument("--size-mb", type=int, default=1024, help="Size of the test file, in MiB")
+    parser.add_argument("--include-legacy", action="store_true", help="Also time the previous read/write copy")
+    parser.add_argument("--directory", type=str, default=None, help="Directory to create the test files in")
+    options = parser.parse_args(args)
+
+    report = run(size_mb=options.size_mb, repeat=options.repeat, include_legacy=options.include_legacy,
+                 directory=options.directory)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark the JSON backends available to python8.core.json_backend on typical payloads.
+
+Usage:
+    python -m python8.bench.json_backend [--repeat N] [--output report.json]
+"""
+import json
+import sys
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import json_backend
+
+
+def _payloads() -> dict:
+    record = {
+        "id": 123456,
+        "name": "Example Record",
+        "email": "someone@example.com",
+        "active": True,
+        "score": 98.6,
+        "tags": ["alpha", "beta", "gamma"],
+        "address": {"street": "1 Main St", "city": "Springfield", "zip": "12345"},
+        "notes": None,
+    }
+    return {
+        "small API response": {"status": "ok", "data": record},
+        "100 records": {"results": [dict(record, id=i) for i in range(100)]},
+        "10,000 records": {"results": [dict(record, id=i) for i in range(10000)]},
+    }
+
+
+def run(repeat: int = 5) -> dict:
+    """
+    Time compact serialization and parsing of typical payloads with each installed backend.
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :return: Report dictionary
+    :rtype: dict
+    """
+    previous_backend = json_backend.get_backend()
+    backends = list(reversed(json_backend.available_backends()))
+
+    results = []
+    try:
+        for payload_name, payload in _payloads().items():
+            encoded = json.dumps(payload, separators=(',', ':'))
+            number = max(1, 100000 // len(encoded))
+            baseline_dumps = time_call(lambda: json.dumps(payload, separators=(',', ':')), number=number,
+                                       repeat=repeat)
+            baseline_loads = time_call(lambda: json.loads(encoded), number=number, repeat=repeat)
+
+            for backend in backends:
+                json_backend.set_backend(backend)
+                dumps_seconds = time_call(lambda: json_backend.dumps(payload, compact=True), number=number,
+                                          repeat=repeat)
+                loads_seconds = time_call(lambda: json_backend.loads(encoded), number=number, repeat=repeat)
+                results.append({
+                    "payload": payload_name,
+                    "backend": backend,
+                    "bytes": len(encoded),
+                    "dumps_us": dumps_seconds * 1_000_000,
+                    "loads_us": loads_seconds * 1_000_000,
+                    "dumps_speedup": baseline_dumps / dumps_seconds,
+                    "loads_speedup": baseline_loads / loads_seconds,
+                })
+    finally:
+        json_backend.set_backend(previous_backend)
+
+    return {**environment(), "benchmark": "json_backend", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark the available JSON backends")
+    options = parser.parse_args(args)
+
+    report = run(repeat=options.repeat)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark pickling large payloads with python8.core.objects: in-band versus out-of-band (protocol 5) buffers, and
+each installed compression codec.
+
+Usage:
+    python -m python8.bench.pickles [--size-mb N] [--repeat N] [--directory DIR] [--output report.json]
+"""
+import os
+import sys
+import tempfile
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import objects
+
+
+def _payloads(size_mb: int) -> dict:
+    size = size_mb * 1024 * 1024
+    line = b"2024-01-01T00:00:00Z INFO request handled path=/api/v1/items status=200 duration_ms=12\n"
+    payloads = {
+        "random bytes": {"chunks": [os.urandom(size // 4) for _ in range(4)]},
+        "log bytearray": {"log": bytearray(line * (size // len(line)))},
+    }
+    try:
+        import numpy
+        payloads["numpy float64"] = {"array": numpy.random.default_rng(0).random(size // 8)}
+    except ImportError:
+        pass
+    return payloads
+
+
+def run(size_mb: int = 64, repeat: int = 3, directory: str = None) -> dict:
+    """
+    Time dumping and loading large payloads to and from a file, and compare the file sizes.
+    :param size_mb: Approximate size of each payload, in MiB
+    :type size_mb: int
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :param directory: (Optional) Directory to write the test files in (defaults to the system temp directory)
+    :type directory: str
+    :return: Report dictionary
+    :rtype: dict
+    """
+    cases = [
+        ("default protocol", {}),
+        ("protocol 5", {"protocol": 5}),
+        ("protocol 5 out-of-band", {"out_of_band": True}),
+    ]
+    for codec in objects.available_compression_codecs():
+        cases.append((f"out-of-band + {codec}", {"out_of_band": True, "compression": codec}))
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=directory) as folder:
+        file_path = os.path.join(folder, "payload.pkl")
+        for payload_name, payload in _payloads(size_mb=size_mb).items():
+            for case_name, options in cases:
+                dump_seconds = time_call(lambda: objects.object_to_pickle_file(payload, file_path, **options),
+                                         number=1, repeat=repeat)
+                load_seconds = time_call(lambda: objects.pickle_file_to_object(file_path), number=1, repeat=repeat)
+                results.append({
+                    "payload": payload_name,
+                    "case": case_name,
+                    "file_mb": os.path.getsize(file_path) / (1024 * 1024),
+                    "dump_ms": dump_seconds * 1000,
+                    "load_ms": load_seconds * 1000,
+                })
+
+    return {**environment(), "benchmark": "pickles", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark out-of-band and compressed pickling of large payloads")
+    parser.add_argument("--size-mb", type=int, default=64, help="Approximate size of each payload, in MiB")
+    parser.add_argument("--directory", type=str, default=None, help="Directory to write the test files in")
+    options = parser.parse_args(args)
+
+    report = run(size_mb=options.size_mb, repeat=options.repeat, directory=options.directory)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark the serializers in python8.core.serializers: encode and decode throughput, and encoded size, on
+representative payloads.
+
+Usage:
+    python -m python8.bench.serializers [--repeat N] [--output report.json]
+"""
+import sys
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import serializers
+
+
+def _payloads() -> dict:
+    record = {
+        "id": 123456,
+        "name": "Example Record",
+        "email": "someone@example.com",
+        "active": True,
+        "score": 98.6,
+        "tags": ["alpha", "beta", "gamma"],
+        "address": {"street": "1 Main St", "city": "Springfield", "zip": "12345"},
+        "notes": None,
+    }
+    return {
+        "small record": record,
+        "10,000 records": {"results": [dict(record, id=i) for i in range(10000)]},
+        "100,000 floats": {"values": [i / 7 for i in range(100000)]},
+        "10,000 short strings": {"words": [f"word-{i}" for i in range(10000)]},
+    }
+
+
+def run(repeat: int = 5) -> dict:
+    """
+    Time encoding and decoding each payload with each installed serializer.
+    Payloads a serializer cannot encode (e.g. JSON and non-string keys) are skipped.
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :return: Report dictionary
+    :rtype: dict
+    """
+    results = []
+    for payload_name, payload in _payloads().items():
+        for name in serializers.available_serializers():
+            serializer = serializers.get_serializer(name)
+            try:
+                encoded = serializer.dumps(payload)
+            except (TypeError, ValueError):
+                continue
+            number = max(1, 1000000 // len(encoded))
+            dumps_seconds = time_call(lambda: serializer.dumps(payload), number=number, repeat=repeat)
+            loads_seconds = time_call(lambda: serializer.loads(encoded), number=number, repeat=repeat)
+            results.append({
+                "payload": payload_name,
+                "serializer": name,
+                "bytes": len(encoded),
+                "dumps_mb_per_second": len(encoded) / dumps_seconds / 1_000_000,
+                "loads_mb_per_second": len(encoded) / loads_seconds / 1_000_000,
+                "dumps_us": dumps_seconds * 1_000_000,
+                "loads_us": loads_seconds * 1_000_000,
+            })
+
+    return {**environment(), "benchmark": "serializers", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark the available serializers")
+    options = parser.parse_args(args)
+
+    report = run(repeat=options.repeat)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
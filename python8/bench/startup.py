@@ -0,0 +1,210 @@
+"""
+Import-time and cold-start benchmark for every python8 module.
+
+Each target is imported in a fresh interpreter so that results are not skewed by previously-loaded modules.
+
+Usage:
+    python -m python8.bench.startup [--repeat N] [--output report.json] [--compare baseline.json] [--threshold 0.25]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from typing import List, Union
+
+from python8 import _CORE_MODULES, __version__
+from python8.internal import constants
+
+# Code run in the child interpreter: import the target and report timing, peak RSS and newly-loaded modules
+_PROBE = """
+import json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+target = sys.argv[1]
+before_modules = set(sys.modules)
+rss_before = _peak_rss_kb()
+error = None
+start = time.perf_counter()
+try:
+    __import__(target)
+except Exception as e:
+    error = f'{type(e).__name__}: {e}'
+elapsed = time.perf_counter() - start
+rss_after = _peak_rss_kb()
+
+stdlib = getattr(sys, 'stdlib_module_names', set())
+new_modules = set(sys.modules) - before_modules
+third_party = sorted({
+    name.split('.')[0] for name in new_modules
+    if name.split('.')[0] not in stdlib and not name.startswith('python8') and not name.startswith('_')
+})
+print(json.dumps({
+    'import_seconds': elapsed,
+    'peak_rss_kb': rss_after,
+    'rss_delta_kb': (rss_after - rss_before) if rss_after is not None else None,
+    'modules_loaded': len(new_modules),
+    'third_party_modules': third_party,
+    'error': error,
+}))
+"""
+
+
+def get_targets() -> List[str]:
+    """
+    Get the names of every python8 module to benchmark.
+    :return: List of fully-qualified module names
+    :rtype: List[str]
+    """
+    targets = ["python8"]
+    targets.extend(f"python8.core.{name}" for name in _CORE_MODULES)
+    targets.extend(f"python8.{name}" for name in constants.MODULES)
+    return targets
+
+
+def _probe_once(target: str) -> dict:
+    """
+    Import a module in a fresh interpreter and collect its startup statistics.
+    :param target: Fully-qualified module name to import
+    :type target: str
+    :return: Statistics reported by the child interpreter
+    :rtype: dict
+    """
+    result = subprocess.run([sys.executable, "-c", _PROBE, target], capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr else "Unknown error"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark_target(target: str, repeat: int = 5) -> dict:
+    """
+    Benchmark the cold-start import of a single module.
+    :param target: Fully-qualified module name to import
+    :type target: str
+    :param repeat: Number of fresh interpreters to sample
+    :type repeat: int
+    :return: Aggregated statistics for the module
+    :rtype: dict
+    """
+    samples = [_probe_once(target) for _ in range(repeat)]
+    errors = [s["error"] for s in samples if s.get("error")]
+    timings = [s["import_seconds"] for s in samples if "import_seconds" in s]
+    rss = [s["peak_rss_kb"] for s in samples if s.get("peak_rss_kb") is not None]
+    last = samples[-1]
+
+    return {
+        "module": target,
+        "import_seconds_min": min(timings) if timings else None,
+        "import_seconds_median": statistics.median(timings) if timings else None,
+        "peak_rss_kb": max(rss) if rss else None,
+        "rss_delta_kb": last.get("rss_delta_kb"),
+        "modules_loaded": last.get("modules_loaded"),
+        "third_party_modules": last.get("third_party_modules", []),
+        "error": errors[0] if errors else None,
+    }
+
+
+def run(repeat: int = 5, targets: List[str] = None) -> dict:
+    """
+    Benchmark every target and build a machine-readable report.
+    :param repeat: Number of fresh interpreters to sample per module
+    :type repeat: int
+    :param targets: (Optional) Modules to benchmark. Defaults to every python8 module.
+    :type targets: List[str], optional
+    :return: Report dictionary
+    :rtype: dict
+    """
+    targets = targets or get_targets()
+    return {
+        "python8_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": [benchmark_target(target=target, repeat=repeat) for target in targets],
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.25) -> List[str]:
+    """
+    Compare a report against a baseline report and list any regressions.
+    :param report: Current report
+    :type report: dict
+    :param baseline: Baseline report (e.g. from the previous release)
+    :type baseline: dict
+    :param threshold: Allowed relative slowdown of the median import time before it is considered a regression
+    :type threshold: float
+    :return: Human-readable regression messages (empty if none)
+    :rtype: List[str]
+    """
+    regressions = []
+    baseline_results = {r["module"]: r for r in baseline.get("results", [])}
+    for current in report["results"]:
+        previous = baseline_results.get(current["module"])
+        if not previous:
+            continue
+
+        old_time: Union[float, None] = previous.get("import_seconds_median")
+        new_time: Union[float, None] = current.get("import_seconds_median")
+        if old_time and new_time and new_time > old_time * (1 + threshold):
+            regressions.append(f"{current['module']}: import time {old_time * 1000:.1f}ms -> {new_time * 1000:.1f}ms")
+
+        added = set(current.get("third_party_modules", [])) - set(previous.get("third_party_modules", []))
+        if added:
+            regressions.append(f"{current['module']}: new third-party imports {', '.join(sorted(added))}")
+    return regressions
+
+
+def _print_table(report: dict) -> None:
+    print(f"{'module':<32} {'median ms':>10} {'peak RSS KB':>12}  third-party")
+    for r in report["results"]:
+        if r["error"] and r["import_seconds_median"] is None:
+            print(f"{r['module']:<32} {'-':>10} {'-':>12}  ERROR: {r['error']}")
+            continue
+        median_ms = r["import_seconds_median"] * 1000
+        details = ', '.join(r['third_party_modules'])
+        if r["error"]:
+            details = f"{details} (ERROR: {r['error']})".strip()
+        print(f"{r['module']:<32} {median_ms:>10.2f} {r['peak_rss_kb'] or 0:>12}  {details}")
+
+
+def main(args: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark python8 import time and cold-start cost")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to sample per module")
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON report to this file")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative import-time slowdown")
+    parser.add_argument("modules", nargs="*", help="Specific modules to benchmark (default: all)")
+    options = parser.parse_args(args)
+
+    report = run(repeat=options.repeat, targets=options.modules)
+    _print_table(report)
+
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+
+    if options.compare:
+        with open(options.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report=report, baseline=baseline, threshold=options.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
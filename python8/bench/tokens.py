@@ -0,0 +1,63 @@
+"""
+Benchmark pooled token and UUID generation against the per-call path.
+
+Usage:
+    python -m python8.bench.tokens [--count N] [--repeat N] [--output report.json]
+"""
+import secrets
+import sys
+import uuid
+from typing import List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report, time_call
+from python8.core import crypto
+from python8.core import uuid as python8_uuid
+
+
+def run(count: int = 10000, repeat: int = 5) -> dict:
+    """
+    Time generating a batch of tokens and UUIDs one at a time versus from a shared random pool.
+    :param count: Number of tokens/UUIDs per batch
+    :type count: int
+    :param repeat: Number of repeats per measurement
+    :type repeat: int
+    :return: Report dictionary
+    :rtype: dict
+    """
+    cases = {
+        "token: secrets.token_urlsafe (per call)": lambda: [secrets.token_urlsafe(24) for _ in range(count)],
+        "token: generate_random_tokens (pooled)": lambda: crypto.generate_random_tokens(count=count),
+        "token: alphanumeric (pooled)": lambda: crypto.generate_random_tokens(
+            count=count, alphabet=crypto.ALPHANUMERIC_ALPHABET),
+        "uuid4: uuid.uuid4 (per call)": lambda: [uuid.uuid4() for _ in range(count)],
+        "uuid4: random_uuids (pooled)": lambda: python8_uuid.random_uuids(count=count),
+    }
+
+    results = []
+    for name, func in cases.items():
+        seconds = time_call(func, number=1, repeat=repeat)
+        results.append({
+            "case": name,
+            "count": count,
+            "batch_seconds": seconds,
+            "per_item_us": seconds / count * 1_000_000,
+            "items_per_second": count / seconds,
+        })
+
+    return {**environment(), "benchmark": "tokens", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark pooled token and UUID generation")
+    parser.add_argument("--count", type=int, default=10000, help="Tokens/UUIDs generated per batch")
+    options = parser.parse_args(args)
+
+    report = run(count=options.count, repeat=options.repeat)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
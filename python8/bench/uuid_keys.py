@@ -0,0 +1,110 @@
+"""
+Benchmark SQLite insert throughput and file size for random (v4) string keys versus time-ordered (v7) binary keys.
+
+Requires the "database" extension (SQLAlchemy).
+
+Usage:
+    python -m python8.bench.uuid_keys [--rows N] [--batch-size N] [--output report.json]
+"""
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+from python8.bench._utils import build_parser, environment, print_results, save_report
+from python8.core import uuid as python8_uuid
+
+
+def _build_models():
+    from sqlalchemy import Column, String
+    from sqlalchemy.orm import DeclarativeBase
+
+    from python8.database.types import BinaryUUID
+
+    class _BenchmarkBase(DeclarativeBase):
+        pass
+
+    class StringKeyRow(_BenchmarkBase):
+        __tablename__ = 'string_keys'
+        id = Column("id", String(36), primary_key=True)
+        payload = Column("payload", String(64), nullable=False)
+
+    class BinaryKeyRow(_BenchmarkBase):
+        __tablename__ = 'binary_keys'
+        id = Column("id", BinaryUUID(), primary_key=True)
+        payload = Column("payload", String(64), nullable=False)
+
+    return StringKeyRow, BinaryKeyRow
+
+
+def _insert_rows(table_schema, make_key: Callable, rows: int, batch_size: int) -> dict:
+    from python8.database.base import SQLAlchemyDatabase
+
+    with tempfile.TemporaryDirectory() as folder:
+        sqlite_file = os.path.join(folder, "benchmark.db")
+        database = SQLAlchemyDatabase(sqlite_file=sqlite_file)
+        table_schema.__table__.create(bind=database.engine, checkfirst=True)
+
+        start = time.perf_counter()
+        for batch_start in range(0, rows, batch_size):
+            batch = [table_schema(id=make_key(), payload="x" * 64)
+                     for _ in range(min(batch_size, rows - batch_start))]
+            database.session.add_all(batch)
+            database._commit()
+        elapsed = time.perf_counter() - start
+
+        database._close()
+        database.engine.dispose()
+        file_size = os.path.getsize(sqlite_file)
+
+    return {
+        "rows": rows,
+        "insert_seconds": elapsed,
+        "rows_per_second": rows / elapsed,
+        "file_size_bytes": file_size,
+        "bytes_per_row": file_size / rows,
+    }
+
+
+def run(rows: int = 100000, batch_size: int = 1000) -> dict:
+    """
+    Insert the same number of rows keyed by uuid4 strings and by uuid7 BLOBs, and compare.
+    :param rows: Number of rows to insert per case
+    :type rows: int
+    :param batch_size: Number of rows per transaction
+    :type batch_size: int
+    :return: Report dictionary
+    :rtype: dict
+    """
+    string_key_row, binary_key_row = _build_models()
+    cases = {
+        "uuid4 as String(36)": (string_key_row, lambda: str(python8_uuid.random_uuid())),
+        "uuid7 as String(36)": (string_key_row, lambda: str(python8_uuid.time_ordered_uuid())),
+        "uuid4 as BinaryUUID": (binary_key_row, python8_uuid.random_uuid),
+        "uuid7 as BinaryUUID": (binary_key_row, python8_uuid.time_ordered_uuid),
+    }
+
+    results = []
+    for name, (table_schema, make_key) in cases.items():
+        results.append({"case": name, **_insert_rows(table_schema=table_schema, make_key=make_key, rows=rows,
+                                                     batch_size=batch_size)})
+
+    return {**environment(), "benchmark": "uuid_keys", "results": results}
+
+
+def main(args: List[str] = None) -> int:
+    parser = build_parser(description="Benchmark SQLite inserts with uuid4 string keys and uuid7 binary keys")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows to insert per case")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction")
+    options = parser.parse_args(args)
+
+    report = run(rows=options.rows, batch_size=options.batch_size)
+    print_results(report["results"])
+    if options.output:
+        save_report(report=report, file_path=options.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import os
 from typing import Any, Callable, Optional
 
 import python8.core.dictionaries as json
+import python8.core.json_backend as json_backend
 import python8.core.yaml as yaml
 
 from python8.core.general import set_default_if_none_or_empty
@@ -54,7 +55,8 @@ class Config:
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
         self.yaml_data = yaml.load_from_file(file_path=config_path)
-        self.json_data = json.load_from_string(json.object_to_json_string(self.yaml_data))
+        # Round-trip through JSON to normalize the YAML data into JSON-compatible types
+        self.json_data = json.load_dict_from_json(json_string=json_backend.dumps(self.yaml_data, compact=True))
 
         self.root_section = ConfigSection(data=self.json_data)
 
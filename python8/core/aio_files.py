@@ -0,0 +1,173 @@
+"""
+Asyncio versions of the python8.core.files functions.
+Blocking file I/O is offloaded to a bounded thread pool, so it does not stall the event loop.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Union
+
+from python8.core import files
+from python8.core.files import FileMode
+
+# Default number of threads used for file I/O
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_executor: Union[ThreadPoolExecutor, None] = None
+_executor_lock = threading.Lock()
+
+
+def configure_executor(max_workers: int = DEFAULT_MAX_WORKERS) -> ThreadPoolExecutor:
+    """
+    Replace the thread pool used for file I/O.
+    :param max_workers: Maximum number of concurrent file operations
+    :type max_workers: int
+    :return: The new thread pool
+    :rtype: ThreadPoolExecutor
+    """
+    global _executor
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="python8-aio-files")
+    with _executor_lock:
+        previous = _executor
+        _executor = executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used for file I/O, creating it with the default size if needed.
+    :return: The thread pool
+    :rtype: ThreadPoolExecutor
+    """
+    global _executor
+    executor = _executor
+    if executor is not None:
+        return executor
+    # Check again under the lock, so concurrent first calls share one pool rather than each creating their own
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="python8-aio-files")
+        return _executor
+
+
+async def _run(func: Callable, *args, executor: ThreadPoolExecutor = None, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def read_from_file(filename, read_mode: FileMode = FileMode.READ,
+                         executor: ThreadPoolExecutor = None) -> Union[str, bytes]:
+    """
+    Read text from file
+    :param filename: File to read from
+    :type filename: str
+    :param read_mode: Mode to read file in
+    :type read_mode: FileMode
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :type executor: ThreadPoolExecutor
+    :return: Text from file
+    :rtype: Union[str, bytes]
+    """
+    return await _run(files.read_from_file, filename, read_mode=read_mode, executor=executor)
+
+
+async def write_to_file(text, filename, write_mode: FileMode = FileMode.WRITE_READ, compression_level: int = None,
+                        executor: ThreadPoolExecutor = None) -> None:
+    """
+    Write text to file
+    :param text: Text to write
+    :type text: str
+    :param filename: File to write to
+    :type filename: str
+    :param write_mode: Mode to write file in
+    :type write_mode: FileMode
+    :param compression_level: (Optional) Compression level for compressed files (.gz, .bz2, .xz or .zst)
+    :type compression_level: int
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :type executor: ThreadPoolExecutor
+    :return: None
+    :rtype: None
+    """
+    await _run(files.write_to_file, text=text, filename=filename, write_mode=write_mode,
+               compression_level=compression_level, executor=executor)
+
+
+async def save_file(file, folder: str, file_name: str = None, max_size: int = None,
+                    executor: ThreadPoolExecutor = None) -> str:
+    """
+    Save a file to a specified folder with an optional file name.
+    :param file: The file object to be saved.
+    :param folder: The folder where the file will be saved.
+    :param file_name: The name of the file. If None, a random name will be used.
+    :param max_size: (Optional) Maximum number of bytes to accept.
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :return: The path to the saved file.
+    """
+    return await _run(files.save_file, file=file, folder=folder, file_name=file_name, max_size=max_size,
+                      executor=executor)
+
+
+async def delete_file(file_path: str, executor: ThreadPoolExecutor = None) -> None:
+    """
+    Delete a file if it exists.
+    :param file_path: The path to the file to be deleted.
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    """
+    await _run(files.delete_file, file_path=file_path, executor=executor)
+
+
+async def gather_read(paths: List[str], read_mode: FileMode = FileMode.READ,
+                      executor: ThreadPoolExecutor = None) -> List[Union[str, bytes]]:
+    """
+    Read many files concurrently
+    :param paths: Files to read from
+    :type paths: List[str]
+    :param read_mode: Mode to read files in
+    :type read_mode: FileMode
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :type executor: ThreadPoolExecutor
+    :return: Contents of each file, in the same order as paths
+    :rtype: List[Union[str, bytes]]
+    """
+    return await asyncio.gather(*[read_from_file(path, read_mode=read_mode, executor=executor) for path in paths])
+
+
+def _default_write_mode(content: Union[str, bytes]) -> FileMode:
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return FileMode.WRITE_READ_BYTES
+    return FileMode.WRITE_READ
+
+
+async def gather_write(texts: Dict[str, Union[str, bytes]], write_mode: FileMode = None,
+                       executor: ThreadPoolExecutor = None) -> None:
+    """
+    Write many files concurrently
+    :param texts: Dictionary of file path to text (or bytes) to write
+    :type texts: Dict[str, Union[str, bytes]]
+    :param write_mode: (Optional) Mode to write files in. Defaults to binary mode for bytes and text mode for text.
+    :type write_mode: FileMode
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :type executor: ThreadPoolExecutor
+    :return: None
+    :rtype: None
+    """
+    await asyncio.gather(*[write_to_file(text, filename, write_mode=write_mode or _default_write_mode(text),
+                                         executor=executor)
+                           for filename, text in texts.items()])
+
+
+async def gather_delete(paths: List[str], executor: ThreadPoolExecutor = None) -> None:
+    """
+    Delete many files concurrently
+    :param paths: Files to delete
+    :type paths: List[str]
+    :param executor: (Optional) Thread pool to use instead of the shared one
+    :type executor: ThreadPoolExecutor
+    :return: None
+    :rtype: None
+    """
+    await asyncio.gather(*[delete_file(path, executor=executor) for path in paths])
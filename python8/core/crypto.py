@@ -1,6 +1,18 @@
 import hashlib
 import hmac
+import os
 import secrets
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List
+
+# Default read size when hashing files (1 MiB)
+DEFAULT_HASH_BUFFER_SIZE = 1024 * 1024
+
+# Same alphabet as secrets.token_urlsafe
+URL_SAFE_ALPHABET = string.ascii_uppercase + string.ascii_lowercase + string.digits + "-_"
+ALPHANUMERIC_ALPHABET = string.ascii_letters + string.digits
 
 
 def _bytes_to_hash(_input: bytes) -> str:
@@ -30,6 +42,64 @@ def generate_hash(secret: str) -> str:
     return _string_to_hash(secret)
 
 
+def hash_file_object(file_object: BinaryIO, algorithm: str = "sha256",
+                     buffer_size: int = DEFAULT_HASH_BUFFER_SIZE) -> str:
+    """
+    Hash the contents of a binary file-like object, reading it in chunks.
+    Memory use is constant (one buffer of buffer_size bytes), regardless of the size of the file.
+    :param file_object: File-like object opened in binary mode, read from its current position.
+    :param algorithm: Name of any algorithm supported by hashlib (e.g. "sha256", "sha1", "md5", "blake2b").
+    :param buffer_size: Number of bytes to read at a time.
+    :return: hex digest of the contents.
+    """
+    hasher = hashlib.new(algorithm)
+
+    if not hasattr(file_object, 'readinto'):
+        for chunk in iter(lambda: file_object.read(buffer_size), b''):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+    # Re-use a single buffer, and hand slices of it to hashlib without copying
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        size = file_object.readinto(buffer)
+        if not size:
+            break
+        hasher.update(view[:size])
+    return hasher.hexdigest()
+
+
+def hash_file(file_path: str, algorithm: str = "sha256", buffer_size: int = DEFAULT_HASH_BUFFER_SIZE) -> str:
+    """
+    Hash the contents of a file, reading it in chunks.
+    Memory use is constant (one buffer of buffer_size bytes), regardless of the size of the file.
+    :param file_path: Path to the file to hash.
+    :param algorithm: Name of any algorithm supported by hashlib (e.g. "sha256", "sha1", "md5", "blake2b").
+    :param buffer_size: Number of bytes to read at a time.
+    :return: hex digest of the file contents.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        return hash_file_object(file_object=f, algorithm=algorithm, buffer_size=buffer_size)
+
+
+def hash_files(file_paths: List[str], algorithm: str = "sha256", buffer_size: int = DEFAULT_HASH_BUFFER_SIZE,
+               max_workers: int = None) -> Dict[str, str]:
+    """
+    Hash many files in parallel on a thread pool (hashlib releases the GIL while hashing).
+    Memory use is constant per worker (one buffer of buffer_size bytes), regardless of the size of the files.
+    :param file_paths: Paths to the files to hash.
+    :param algorithm: Name of any algorithm supported by hashlib (e.g. "sha256", "sha1", "md5", "blake2b").
+    :param buffer_size: Number of bytes to read at a time, per file.
+    :param max_workers: (Optional) Maximum number of threads. Defaults to the ThreadPoolExecutor default.
+    :return: Dictionary of file path to hex digest, in the same order as file_paths.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(lambda path: hash_file(file_path=path, algorithm=algorithm, buffer_size=buffer_size),
+                               file_paths)
+        return dict(zip(file_paths, digests))
+
+
 def hash_matches(_input: str, hashed: str) -> bool:
     """
     Check if a string, when hashed, matches another string.
@@ -47,3 +117,105 @@ def generate_random_alphanumeric_string() -> str:
     :return: random alphanumeric string.
     """
     return secrets.token_urlsafe(24)
+
+
+class SecureRandomPool:
+    """
+    Thread-safe pool of cryptographically-secure random bytes.
+    Bytes are drawn from os.urandom in large blocks and each byte is handed out exactly once.
+    """
+
+    def __init__(self, pool_size: int = 64 * 1024):
+        """
+        :param pool_size: Number of bytes to draw from os.urandom at a time.
+        :type pool_size: int
+        """
+        self.pool_size = pool_size
+        self._buffer = b''
+        self._offset = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def get_bytes(self, size: int) -> bytes:
+        """
+        Get random bytes from the pool, refilling it if needed.
+        :param size: Number of bytes to get.
+        :type size: int
+        :return: Random bytes.
+        :rtype: bytes
+        """
+        with self._lock:
+            # Never share buffered bytes with a forked child process
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._buffer, self._offset = b'', 0
+
+            available = len(self._buffer) - self._offset
+            if available < size:
+                self._buffer = self._buffer[self._offset:] + os.urandom(max(self.pool_size, size - available))
+                self._offset = 0
+
+            data = self._buffer[self._offset:self._offset + size]
+            self._offset += size
+            return data
+
+
+_default_pool = SecureRandomPool()
+
+
+def _build_alphabet_tables(alphabet: str) -> tuple[bytes, bytes]:
+    """
+    Build the byte translation tables to map random bytes onto an alphabet without modulo bias.
+    :param alphabet: Characters to map onto (ASCII only, 2-256 unique characters).
+    :return: Translation table and the bytes to reject.
+    """
+    alphabet_bytes = alphabet.encode('ascii')
+    if not 2 <= len(alphabet_bytes) <= 256 or len(set(alphabet_bytes)) != len(alphabet_bytes):
+        raise ValueError("Alphabet must contain between 2 and 256 unique ASCII characters")
+
+    # Reject the top (256 % len) byte values, so every character is equally likely
+    limit = 256 - (256 % len(alphabet_bytes))
+    table = bytes(alphabet_bytes[i % len(alphabet_bytes)] for i in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+
+def generate_random_tokens(count: int, length: int = 32, alphabet: str = URL_SAFE_ALPHABET,
+                           pool: SecureRandomPool = None) -> List[str]:
+    """
+    Generate many random tokens from a shared pool of cryptographically-secure random bytes.
+    :param count: Number of tokens to generate.
+    :param length: Length of each token (default 32, the same as generate_random_alphanumeric_string).
+    :param alphabet: Characters to build the tokens from (default URL-safe base64 characters).
+    :param pool: (Optional) Random byte pool to draw from. Defaults to a shared module-level pool.
+    :return: List of random tokens.
+    :raises ValueError: If length is less than 1, count is negative, or the alphabet is invalid.
+    """
+    if length < 1:
+        raise ValueError(f"Token length must be at least 1, not {length}")
+    if count < 0:
+        raise ValueError(f"Token count must not be negative, not {count}")
+    pool = pool or _default_pool
+    table, rejected = _build_alphabet_tables(alphabet=alphabet)
+
+    needed = count * length
+    characters = b''
+    while len(characters) < needed:
+        # Over-draw slightly to cover rejected bytes
+        missing = needed - len(characters)
+        characters += pool.get_bytes(missing + missing * len(rejected) // 256 + 16).translate(table, rejected)
+
+    text = characters[:needed].decode('ascii')
+    return [text[i:i + length] for i in range(0, needed, length)]
+
+
+def generate_random_token(length: int = 32, alphabet: str = URL_SAFE_ALPHABET,
+                          pool: SecureRandomPool = None) -> str:
+    """
+    Generate a single random token from a shared pool of cryptographically-secure random bytes.
+    :param length: Length of the token (default 32, the same as generate_random_alphanumeric_string).
+    :param alphabet: Characters to build the token from (default URL-safe base64 characters).
+    :param pool: (Optional) Random byte pool to draw from. Defaults to a shared module-level pool.
+    :return: Random token.
+    """
+    return generate_random_tokens(count=1, length=length, alphabet=alphabet, pool=pool)[0]
@@ -1,5 +1,17 @@
 import json
-from typing import List
+import sqlite3
+from typing import Any, IO, Iterable, Iterator, List, Union
+
+import python8.core.json_backend as json_backend
+from python8.core.files import FileMode, open_file
+from python8.core.serializers import Serializer, get_serializer
+from python8.core.sqlite_dict import LazySQLiteDict
+
+# Characters read at a time when streaming a JSON array
+DEFAULT_JSON_STREAM_BUFFER_SIZE = 64 * 1024
+
+# Characters that can continue a JSON number (so one that is followed by them may not have been read in full)
+_NUMBER_CONTINUATION_CHARACTERS = frozenset('0123456789.eE+-')
 
 
 def load_dict_from_json(json_string: str) -> dict:
@@ -11,39 +23,190 @@ def load_dict_from_json(json_string: str) -> dict:
     :return: Dictionary representation of the JSON string
     :rtype: dict
     """
-    return json.loads(json_string)
+    return json_backend.loads(json_string)
 
 
-def load_dict_from_file(file_path: str) -> dict:
+def load_dict_from_file(file_path: str, serializer: Union[str, Serializer] = None) -> dict:
     """
     Convert a JSON file into a Python dictionary.
+    Files ending in .gz, .bz2, .xz or .zst are decompressed with the matching codec.
 
     :param file_path: Path to the JSON file
     :type file_path: str
+    :param serializer: (Optional) Serializer the file was saved with (see python8.core.serializers), if not JSON text
+    :type serializer: Union[str, Serializer], optional
     :return: Dictionary representation of the JSON file
     :rtype: dict
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return json.load(file)
+    if serializer is not None:
+        with open_file(file_path, mode=FileMode.READ_BYTES) as file:
+            return get_serializer(serializer).loads(file.read())
+    with _open_text_file(file_path=file_path, mode='r') as file:
+        return json_backend.load(file)
+
+
+def _sqlite_codec(serializer: Union[str, Serializer, None]) -> dict:
+    """
+    Get the LazySQLiteDict encode and decode arguments for a serializer (None for the sqlitedict-compatible pickle).
+    """
+    if serializer is None:
+        return {}
+    serializer = get_serializer(serializer)
+    return {
+        "encode": lambda value: sqlite3.Binary(serializer.dumps(value)),
+        "decode": serializer.loads,
+    }
+
+
+def _open_text_file(file_path: str, mode: str, compressed: bool = None, compression_level: int = None) -> IO[str]:
+    """
+    Open a UTF-8 text file, transparently (de)compressing it if needed.
+
+    :param file_path: Path to the file
+    :type file_path: str
+    :param mode: 'r', 'w' or 'a'
+    :type mode: str
+    :param compressed: (Optional) Whether the file is compressed. Defaults to checking for a .gz, .bz2, .xz or .zst
+    extension (True without one of those extensions means gzip).
+    :type compressed: bool, optional
+    :param compression_level: (Optional) Compression level when writing a compressed file
+    :type compression_level: int, optional
+    :return: Text file object
+    :rtype: IO[str]
+    """
+    return open_file(file_path, mode=FileMode(mode), compression=compressed, compression_level=compression_level,
+                     encoding='utf-8')
+
+
+def load_dicts_from_json_lines_file(file_path: str, compressed: bool = None) -> Iterator[dict]:
+    """
+    Lazily read dictionaries from a JSON Lines file, one line at a time (constant memory).
+
+    :param file_path: Path to the JSON Lines file
+    :type file_path: str
+    :param compressed: (Optional) Whether the file is compressed. Defaults to checking for a .gz, .bz2, .xz or .zst
+    extension (True without one of those extensions means gzip).
+    :type compressed: bool, optional
+    :return: Generator of dictionaries, one per non-empty line
+    :rtype: Iterator[dict]
+    """
+    with _open_text_file(file_path=file_path, mode='r', compressed=compressed) as file:
+        for line in file:
+            if line.strip():
+                yield json_backend.loads(line)
+
 
+def iterate_json_array_file(file_path: str, compressed: bool = None,
+                            buffer_size: int = DEFAULT_JSON_STREAM_BUFFER_SIZE) -> Iterator[Any]:
+    """
+    Lazily read the elements of a top-level JSON array from a file, without loading the whole array (constant memory,
+    bounded by the size of the largest element).
 
-def load_dict_from_sqlite(file_path: str) -> dict:
+    :param file_path: Path to the JSON file
+    :type file_path: str
+    :param compressed: (Optional) Whether the file is compressed. Defaults to checking for a .gz, .bz2, .xz or .zst
+    extension (True without one of those extensions means gzip).
+    :type compressed: bool, optional
+    :param buffer_size: Number of characters to read at a time
+    :type buffer_size: int
+    :return: Generator of array elements
+    :rtype: Iterator[Any]
+    """
+    decoder = json.JSONDecoder()
+
+    with _open_text_file(file_path=file_path, mode='r', compressed=compressed) as file:
+        buffer = ''
+        position = 0
+        eof = False
+
+        def _fill(size: int) -> bool:
+            nonlocal buffer, position, eof
+            chunk = file.read(size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        def _next_token() -> str:
+            # Skip whitespace, reading more data as needed, and return the next character (or '' at the end)
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not _fill(buffer_size):
+                    return ''
+
+        def _next_element() -> Any:
+            nonlocal position
+            # Double the amount read on each retry, so an element much larger than the buffer is re-parsed a
+            # logarithmic number of times rather than once per buffer_size characters
+            read_size = buffer_size
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                    # A number may continue past what has been read (e.g. "10." or "1.5e" decode as a prefix of
+                    # "10.25" or "1.5e3"), so only accept one once a character that cannot continue it follows
+                    if eof or (end < len(buffer) and buffer[end] not in _NUMBER_CONTINUATION_CHARACTERS):
+                        position = end
+                        return element
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                if _fill(read_size):
+                    read_size *= 2
+
+        def _end_of_array() -> None:
+            nonlocal position
+            position += 1
+            if _next_token() != '':
+                raise ValueError(f"Unexpected data after the JSON array in {file_path}")
+
+        if _next_token() != '[':
+            raise ValueError(f"{file_path} does not contain a top-level JSON array")
+        position += 1
+        if _next_token() == ']':
+            _end_of_array()
+            return
+
+        while True:
+            if _next_token() == '':
+                raise ValueError(f"Unexpected end of file in {file_path}")
+            yield _next_element()
+
+            # Each element must be followed by a comma and another element, or by the end of the array
+            token = _next_token()
+            if token == ']':
+                _end_of_array()
+                return
+            if token != ',':
+                if token == '':
+                    raise ValueError(f"Unexpected end of file in {file_path}")
+                raise ValueError(f"Expected ',' or ']' after an array element in {file_path}, found {token!r}")
+            position += 1
+            if _next_token() == ']':
+                raise ValueError(f"Trailing comma in the JSON array in {file_path}")
+
+
+def load_dict_from_sqlite(file_path: str, serializer: Union[str, Serializer] = None) -> dict:
     """
     Load a dictionary from a SQLite database
 
+    To read only a few keys, use python8.core.sqlite_dict.LazySQLiteDict instead, which does not copy the database.
+
     :param file_path: Path to file
     :type file_path: str
+    :param serializer: (Optional) Serializer the values were saved with. Defaults to pickle, as used by sqlitedict.
+    :type serializer: Union[str, Serializer], optional
     :return: Dictionary
     :rtype: dict
     """
-    import sqlitedict
-    data = {}
-    with sqlitedict.SqliteDict(file_path, autocommit=True) as db:
+    with LazySQLiteDict(file_path=file_path, cache_size=0, **_sqlite_codec(serializer)) as db:
         # copy the data from the sqlite database to the dictionary
-        for k, v in db.items():
-            data[k] = v
-        db.close()
-    return data
+        return dict(db.items())
 
 
 def load_json_from_sqlite(file_path: str) -> str:
@@ -56,22 +219,61 @@ def load_json_from_sqlite(file_path: str) -> str:
     :rtype: dict
     """
     data: dict = load_dict_from_sqlite(file_path=file_path)
-    return json.dumps(data)
+    return json_backend.dumps(data)
 
 
-def save_dict_to_file(file_path: str, dictionary: dict) -> None:
+def save_dict_to_file(file_path: str, dictionary: dict, indent: int = 4, compression_level: int = None,
+                      serializer: Union[str, Serializer] = None) -> None:
     """
     Save a dictionary to a file
+    Files ending in .gz, .bz2, .xz or .zst are compressed with the matching codec.
 
     :param dictionary: Dictionary to save
     :type dictionary: dict
     :param file_path: Path to file
     :type file_path: str
+    :param indent: (Optional) Indentation level, or None for compact output (Default: 4)
+    :type indent: int, optional
+    :param compression_level: (Optional) Compression level for compressed files
+    :type compression_level: int, optional
+    :param serializer: (Optional) Serializer to save with (see python8.core.serializers), instead of JSON text.
+    indent does not apply.
+    :type serializer: Union[str, Serializer], optional
     :return: None
     :rtype: None
     """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(dictionary, f, indent=4)
+    if serializer is not None:
+        with open_file(file_path, mode=FileMode.WRITE_BYTES, compression_level=compression_level) as f:
+            f.write(get_serializer(serializer).dumps(dictionary))
+        return
+    with _open_text_file(file_path=file_path, mode='w', compression_level=compression_level) as f:
+        json_backend.dump(dictionary, f, indent=indent)
+
+
+def save_dicts_to_json_lines_file(file_path: str, dictionaries: Iterable[dict], compressed: bool = None,
+                                  append: bool = False) -> int:
+    """
+    Stream dictionaries to a JSON Lines file, one line at a time (constant memory).
+
+    :param file_path: Path to the JSON Lines file
+    :type file_path: str
+    :param dictionaries: Dictionaries to save (any iterable, including a generator)
+    :type dictionaries: Iterable[dict]
+    :param compressed: (Optional) Whether to compress the file. Defaults to checking for a .gz, .bz2, .xz or .zst
+    extension (True without one of those extensions means gzip).
+    :type compressed: bool, optional
+    :param append: (Optional) Append to the file instead of overwriting it (Default: False)
+    :type append: bool, optional
+    :return: Number of dictionaries written
+    :rtype: int
+    """
+    count = 0
+    with _open_text_file(file_path=file_path, mode='a' if append else 'w', compressed=compressed) as file:
+        for dictionary in dictionaries:
+            file.write(json_backend.dumps(dictionary, compact=True))
+            file.write('\n')
+            count += 1
+    return count
 
 
 def save_json_to_file(file_path: str, data: str) -> None:
@@ -89,24 +291,43 @@ def save_json_to_file(file_path: str, data: str) -> None:
     save_dict_to_file(dictionary=data, file_path=file_path)
 
 
-def save_dict_to_sqlite(file_path: str, dictionary: dict) -> None:
+def save_dict_to_sqlite(file_path: str, dictionary: dict, serializer: Union[str, Serializer] = None) -> dict:
     """
     Save a dictionary to a SQLite database
 
+    Only keys whose values are new or have changed are written. Keys in the database that are not in the dictionary
+    are kept; use sync_dict_to_sqlite to remove them.
+
     :param dictionary: Dictionary to save
     :type dictionary: dict
     :param file_path: Path to file
     :type file_path: str
-    :return: None
-    :rtype: None
+    :param serializer: (Optional) Serializer to save the values with. Defaults to pickle, as used by sqlitedict.
+    :type serializer: Union[str, Serializer], optional
+    :return: Summary of the keys that were "inserted", "updated", "deleted" and the number "unchanged"
+    :rtype: dict
+    """
+    with LazySQLiteDict(file_path=file_path, cache_size=0, **_sqlite_codec(serializer)) as db:
+        return db.sync(dictionary=dictionary, delete_missing=False)
+
+
+def sync_dict_to_sqlite(file_path: str, dictionary: dict, serializer: Union[str, Serializer] = None) -> dict:
+    """
+    Make a SQLite database match a dictionary exactly
+
+    Only keys that were inserted, changed or deleted are written, in a single transaction.
+
+    :param dictionary: Dictionary to save
+    :type dictionary: dict
+    :param file_path: Path to file
+    :type file_path: str
+    :param serializer: (Optional) Serializer to save the values with. Defaults to pickle, as used by sqlitedict.
+    :type serializer: Union[str, Serializer], optional
+    :return: Summary of the keys that were "inserted", "updated", "deleted" and the number "unchanged"
+    :rtype: dict
     """
-    import sqlitedict
-    with sqlitedict.SqliteDict(file_path) as db:
-        # copy the data from the dictionary to the sqlite database
-        for k, v in dictionary.items():
-            db[k] = v
-        db.commit()
-        db.close()
+    with LazySQLiteDict(file_path=file_path, cache_size=0, **_sqlite_codec(serializer)) as db:
+        return db.sync(dictionary=dictionary, delete_missing=True)
 
 
 def save_json_to_sqlite(file_path: str, data: str) -> None:
@@ -133,7 +354,7 @@ def object_to_json_string(obj: object) -> str:
     :return: JSON string representation of the object
     :rtype: str
     """
-    return json.dumps(obj, indent=4)
+    return json_backend.dumps(obj, indent=4)
 
 
 def pretty_print(data: dict, sort: bool = False) -> str:
@@ -147,7 +368,7 @@ def pretty_print(data: dict, sort: bool = False) -> str:
     :return: pretty printed JSON string
     :rtype: str
     """
-    return json.dumps(data, indent=4, sort_keys=sort)
+    return json_backend.dumps(data, indent=4, sort_keys=sort)
 
 
 def combine_dictionaries(old_dictionary: dict, new_dictionary: dict, add_new_items: bool = False) -> dict:
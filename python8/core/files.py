@@ -1,5 +1,64 @@
+import bz2
+import errno
+import fnmatch
+import gzip
+import hashlib
+import locale
+import lzma
+import mmap
 import os
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from enum import Enum
+from typing import IO, BinaryIO, Dict, Iterator, List, Tuple, Union
+
+# Default chunk size when copying or streaming files (1 MiB)
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Errors meaning a zero-copy system call is not supported for these files, rather than a real I/O failure
+_UNSUPPORTED_COPY_ERRORS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EBADF,
+                            errno.EPERM, errno.ENOTSOCK}
+
+
+class FileTooLargeError(ValueError):
+    """
+    Error raised when a file being saved exceeds the maximum allowed size
+    """
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: The maximum allowed size, in bytes
+        """
+        self.max_size = max_size
+        super().__init__(f'File exceeds the maximum allowed size of {max_size} bytes.')
+
+
+class SavedFile:
+    """
+    Details of a file saved by save_file_and_hash.
+    """
+
+    def __init__(self, file_path: str, size: int, content_hash: str, hash_algorithm: str, deduplicated: bool = False):
+        """
+        :param file_path: The path to the saved file.
+        :type file_path: str
+        :param size: The size of the saved file, in bytes.
+        :type size: int
+        :param content_hash: The hex digest of the file contents.
+        :type content_hash: str
+        :param hash_algorithm: The hashlib algorithm used for content_hash.
+        :type hash_algorithm: str
+        :param deduplicated: Whether identical content was already stored, so nothing new was written.
+        :type deduplicated: bool
+        """
+        self.file_path = file_path
+        self.size = size
+        self.content_hash = content_hash
+        self.hash_algorithm = hash_algorithm
+        self.deduplicated = deduplicated
 
 
 class FileMode(Enum):
@@ -7,16 +66,16 @@ class FileMode(Enum):
     Enum for file modes.
     """
     READ = 'r'
-    WRITE = 'w',
-    APPEND = 'a',
-    READ_BYTES = 'rb',
-    WRITE_BYTES = 'wb',
-    APPEND_BYTES = 'ab',
-    READ_WRITE = 'r+',
-    READ_WRITE_BYTES = 'rb+',
-    WRITE_READ = 'w+',
-    WRITE_READ_BYTES = 'wb+',
-    APPEND_READ = 'a+',
+    WRITE = 'w'
+    APPEND = 'a'
+    READ_BYTES = 'rb'
+    WRITE_BYTES = 'wb'
+    APPEND_BYTES = 'ab'
+    READ_WRITE = 'r+'
+    READ_WRITE_BYTES = 'rb+'
+    WRITE_READ = 'w+'
+    WRITE_READ_BYTES = 'wb+'
+    APPEND_READ = 'a+'
     APPEND_READ_BYTES = 'ab+'
 
 
@@ -40,92 +99,1157 @@ def make_path(file_path) -> None:
     :rtype: None
     """
     working_path = split_file_path(file_path)
-    if not os.path.exists(working_path):
+    if working_path and not os.path.exists(working_path):
         os.makedirs(working_path)
 
 
-def write_to_file(text, filename, write_mode: FileMode = FileMode.WRITE_READ) -> None:
+class Compression(Enum):
+    """
+    Enum for the compression codecs supported by open_file.
+    """
+    GZIP = 'gzip'
+    BZ2 = 'bz2'
+    XZ = 'xz'
+    ZSTD = 'zstd'
+
+
+# File extensions that are (de)compressed transparently
+COMPRESSION_EXTENSIONS = {
+    '.gz': Compression.GZIP,
+    '.bz2': Compression.BZ2,
+    '.xz': Compression.XZ,
+    '.zst': Compression.ZSTD,
+}
+
+# Compression level used when none is given (change with set_compression_level)
+# gzip defaults to 6 rather than its maximum of 9, which is much slower for little size gain
+_compression_levels = {
+    Compression.GZIP: 6,
+    Compression.BZ2: 9,
+    Compression.XZ: 6,
+    Compression.ZSTD: 3,
+}
+
+
+def set_compression_level(compression: Compression, level: int) -> None:
+    """
+    Set the default compression level of a codec
+    :param compression: Codec to configure
+    :type compression: Compression
+    :param level: Compression level (gzip and bz2: 1-9, xz: 0-9, zstd: 1-22)
+    :type level: int
+    :return: None
+    :rtype: None
+    """
+    _compression_levels[compression] = level
+
+
+def get_compression(filename) -> Union[Compression, None]:
+    """
+    Get the compression codec of a file from its extension
+    :param filename: File path
+    :type filename: str
+    :return: Compression codec, or None if the file is not compressed
+    :rtype: Union[Compression, None]
+    """
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(str(filename))[1].lower())
+
+
+def _open_zstd(filename, mode: str, level: int, encoding: str = None) -> IO:
+    try:
+        # Standard library from Python 3.14
+        from compression import zstd
+        return zstd.open(filename, mode, level=level if 'r' not in mode else None, encoding=encoding)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Reading or writing .zst files requires the zstandard package (pip install zstandard)")
+    if 'r' in mode:
+        return zstandard.open(filename, mode, encoding=encoding)
+    return zstandard.open(filename, mode, cctx=zstandard.ZstdCompressor(level=level), encoding=encoding)
+
+
+def open_file(filename, mode: FileMode = FileMode.READ, compression: Union[Compression, bool, None] = None,
+              compression_level: int = None, encoding: str = None) -> IO:
+    """
+    Open a file, transparently (de)compressing it based on its extension (.gz, .bz2, .xz or .zst)
+    Compressed files are streamed through the codec, so they are never held in memory whole.
+    :param filename: File to open
+    :type filename: str
+    :param mode: Mode to open file in (compressed files cannot be opened for both reading and writing)
+    :type mode: FileMode
+    :param compression: (Optional) Codec to use, or False to disable compression. Defaults to the file extension.
+    :type compression: Union[Compression, bool, None]
+    :param compression_level: (Optional) Compression level when writing. Defaults to the level set for the codec.
+    :type compression_level: int
+    :param encoding: (Optional) Text encoding (text modes only). Defaults to the locale encoding, as open() does.
+    :type encoding: str
+    :return: File object
+    :rtype: IO
+    """
+    if compression is None or compression is True:
+        compression = get_compression(filename) or (Compression.GZIP if compression else None)
+    if not compression:
+        return open(filename, mode.value, encoding=encoding)
+
+    value = mode.value
+    if '+' in value:
+        # Compressed streams are one-way; "w+" (the write_to_file default) only needs writing
+        if value.startswith('r'):
+            raise ValueError(f"Compressed files cannot be opened in {value!r} mode")
+        value = value.replace('+', '')
+    if 'b' not in value:
+        value += 't'
+    level = compression_level if compression_level is not None else _compression_levels[compression]
+    reading = value.startswith('r')
+
+    if compression == Compression.GZIP:
+        return gzip.open(filename, value, encoding=encoding) if reading \
+            else gzip.open(filename, value, compresslevel=level, encoding=encoding)
+    if compression == Compression.BZ2:
+        return bz2.open(filename, value, encoding=encoding) if reading \
+            else bz2.open(filename, value, compresslevel=level, encoding=encoding)
+    if compression == Compression.XZ:
+        return lzma.open(filename, value, encoding=encoding) if reading \
+            else lzma.open(filename, value, preset=level, encoding=encoding)
+    return _open_zstd(filename, value, level=level, encoding=encoding)
+
+
+def write_to_file(text, filename, write_mode: FileMode = FileMode.WRITE_READ, compression_level: int = None) -> None:
     """
     Write text to file
+    Files ending in .gz, .bz2, .xz or .zst are compressed with the matching codec.
     :param text: Text to write
     :type text: str
     :param filename: File to write to
     :type filename: str
     :param write_mode: Mode to write file in
     :type write_mode: FileMode
+    :param compression_level: (Optional) Compression level for compressed files
+    :type compression_level: int
     :return: None
     :rtype: None
     """
     make_path(filename)
-    f = open(filename, write_mode.value)
-    f.write(text)
-    f.close()
+    with open_file(filename, mode=write_mode, compression_level=compression_level) as f:
+        f.write(text)
+
+
+class BulkFileWriter:
+    """
+    Write many files at once on a thread pool.
+    Directories that have already been created are cached, so each is only checked/created once.
+    """
+
+    def __init__(self, max_workers: int = None, buffer_size: int = -1, write_mode: FileMode = None):
+        """
+        :param max_workers: (Optional) Maximum number of threads. Defaults to the ThreadPoolExecutor default.
+        :type max_workers: int
+        :param buffer_size: Buffer size for each file, passed to open() (-1 for the default, 0 for unbuffered
+        binary writes)
+        :type buffer_size: int
+        :param write_mode: (Optional) Mode to write files in. Defaults to FileMode.WRITE_BYTES for bytes and
+        FileMode.WRITE for text.
+        :type write_mode: FileMode
+        """
+        self.max_workers = max_workers
+        self.buffer_size = buffer_size
+        self.write_mode = write_mode
+        self._created_directories = set()
+        self._directories_lock = threading.Lock()
 
+    def _ensure_directory(self, file_path: str) -> None:
+        directory = os.path.dirname(file_path)
+        if not directory or directory in self._created_directories:
+            return
+        os.makedirs(directory, exist_ok=True)
+        with self._directories_lock:
+            self._created_directories.add(directory)
 
-def read_from_file(filename, read_mode: FileMode = FileMode.READ) -> str:
+    def _write_one(self, file_path: str, data: Union[str, bytes]) -> int:
+        self._ensure_directory(file_path)
+        mode = self.write_mode or (FileMode.WRITE_BYTES if isinstance(data, bytes) else FileMode.WRITE)
+        with open(file_path, mode.value, buffering=self.buffer_size) as f:
+            f.write(data)
+        return len(data)
+
+    def write(self, texts: Dict[str, Union[str, bytes]]) -> dict:
+        """
+        Write a batch of files
+        :param texts: Dictionary of file path to text (or bytes) to write
+        :type texts: Dict[str, Union[str, bytes]]
+        :return: Throughput of the batch: "files", "bytes" (characters, for text), "seconds", "files_per_second" and
+        "bytes_per_second"
+        :rtype: dict
+        """
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            sizes = list(executor.map(lambda item: self._write_one(*item), texts.items()))
+        seconds = time.perf_counter() - start
+
+        total = sum(sizes)
+        return {
+            "files": len(sizes),
+            "bytes": total,
+            "seconds": seconds,
+            "files_per_second": len(sizes) / seconds if seconds else 0.0,
+            "bytes_per_second": total / seconds if seconds else 0.0,
+        }
+
+    def clear_directory_cache(self) -> None:
+        """
+        Forget which directories have been created (e.g. if they may have been deleted since)
+        """
+        with self._directories_lock:
+            self._created_directories.clear()
+
+
+def read_from_file(filename, read_mode: FileMode = FileMode.READ, mmap_threshold: int = None) -> Union[str, bytes]:
     """
     Read text from file
+    Files ending in .gz, .bz2, .xz or .zst are decompressed with the matching codec.
     :param filename: File to read from
     :type filename: str
     :param read_mode: Mode to read file in
     :type read_mode: FileMode
+    :param mmap_threshold: (Optional) Read files of at least this many bytes through a memory map, decoding directly
+    from the mapped pages instead of through an intermediate read buffer (READ and READ_BYTES modes only, and not
+    for compressed files)
+    :type mmap_threshold: int
     :return: Text from file
-    :rtype: str
+    :rtype: Union[str, bytes]
     """
+    if get_compression(filename) is not None:
+        with open_file(filename, mode=read_mode) as f:
+            return f.read()
+
+    if mmap_threshold is not None and read_mode in (FileMode.READ, FileMode.READ_BYTES) \
+            and os.path.getsize(filename) >= mmap_threshold:
+        with MappedFile(filename) as mapped:
+            if read_mode == FileMode.READ_BYTES:
+                return bytes(mapped.view)
+            text = str(mapped.view, locale.getpreferredencoding(False))
+        # Match text mode's universal newlines
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
     with open(filename, read_mode.value) as f:
         text = f.read()
     return text
 
 
-def backup_file(filename, suffix: str = ".bk") -> None:
+class MappedFile:
+    """
+    Read-only memory map of a file.
+    Slices and lines are returned as memoryviews into the mapping, so no data is copied until it is used.
+    Use as a context manager to unmap the file when done.
+    """
+
+    def __init__(self, filename: str):
+        """
+        :param filename: File to map
+        :type filename: str
+        """
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # Empty files cannot be memory-mapped
+        self.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.view = memoryview(self.mmap) if self.mmap is not None else memoryview(b'')
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def read_range(self, start: int, end: int = None) -> memoryview:
+        """
+        Get a range of bytes from the file, without copying
+        :param start: Offset of the first byte
+        :type start: int
+        :param end: (Optional) Offset after the last byte (defaults to the end of the file)
+        :type end: int
+        :return: View of the bytes
+        :rtype: memoryview
+        """
+        return self.view[start:end]
+
+    def find(self, sub: bytes, start: int = 0, end: int = None) -> int:
+        """
+        Find the offset of a byte sequence in the file
+        :param sub: Bytes to look for
+        :type sub: bytes
+        :param start: Offset to start searching from
+        :type start: int
+        :param end: (Optional) Offset to stop searching at
+        :type end: int
+        :return: Offset of the first match, or -1 if not found
+        :rtype: int
+        """
+        if self.mmap is None:
+            return -1
+        return self.mmap.find(sub, start, len(self) if end is None else end)
+
+    def iter_lines(self, keep_ends: bool = False) -> Iterator[memoryview]:
+        """
+        Iterate over the lines of the file, without copying
+        :param keep_ends: Include the trailing newline in each line
+        :type keep_ends: bool
+        :return: Generator of views of each line
+        :rtype: Iterator[memoryview]
+        """
+        position = 0
+        size = len(self)
+        while position < size:
+            newline = self.find(b'\n', position)
+            if newline == -1:
+                yield self.view[position:]
+                return
+            yield self.view[position:newline + 1 if keep_ends else newline]
+            position = newline + 1
+
+    def close(self) -> None:
+        """
+        Unmap and close the file.
+        If views returned by this object are still in use, the mapping stays valid for them, and is unmapped when the
+        last one is released or garbage-collected.
+        """
+        try:
+            try:
+                self.view.release()
+            except BufferError:
+                pass
+            if self.mmap is not None and not self.mmap.closed:
+                try:
+                    self.mmap.close()
+                except BufferError:
+                    # Still exported to a view; the mapping is freed along with the last view
+                    pass
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> 'MappedFile':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def backup_file(filename, suffix: str = ".bk", preserve_metadata: bool = False) -> None:
     """
     Make a backup of a file
     :param filename: File to back up
     :type filename: str
     :param suffix: Suffix to add to file name
     :type suffix: str
+    :param preserve_metadata: Also copy permissions and access/modification times
+    :type preserve_metadata: bool
     :return: None
     :rtype: None
     """
-    copy_file(filename, f'{filename}{suffix}')
+    copy_file(filename, f'{filename}{suffix}', preserve_metadata=preserve_metadata)
+
+
+def _kernel_copy(source_fd: int, destination_fd: int, size: int) -> int:
+    """
+    Copy bytes between two files inside the kernel (os.copy_file_range, then os.sendfile), without passing the data
+    through user space.
+    :param source_fd: File descriptor to copy from
+    :type source_fd: int
+    :param destination_fd: File descriptor to copy to
+    :type destination_fd: int
+    :param size: Number of bytes to copy
+    :type size: int
+    :return: Number of bytes copied (0 if neither system call is supported for these files)
+    :rtype: int
+    """
+    copied = 0
 
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while copied < size:
+                sent = os.copy_file_range(source_fd, destination_fd, size - copied, copied, copied)
+                if sent == 0:
+                    break
+                copied += sent
+            return copied
+        except OSError as e:
+            if copied or e.errno not in _UNSUPPORTED_COPY_ERRORS:
+                raise
+
+    if hasattr(os, 'sendfile'):
+        try:
+            while copied < size:
+                sent = os.sendfile(destination_fd, source_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            return copied
+        except OSError as e:
+            if copied or e.errno not in _UNSUPPORTED_COPY_ERRORS:
+                raise
 
-def copy_file(filename, new_filename) -> None:
+    return copied
+
+
+def copy_file_object(source: BinaryIO, destination: BinaryIO, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Copy the rest of a binary file object into another, in chunks, re-using a single buffer
+    :param source: File object to read from
+    :type source: BinaryIO
+    :param destination: File object to write to
+    :type destination: BinaryIO
+    :param buffer_size: Number of bytes to copy at a time
+    :type buffer_size: int
+    :return: Number of bytes copied
+    :rtype: int
     """
-    Make a copy of a file
+    if not hasattr(source, 'readinto'):
+        copied = 0
+        for chunk in iter(lambda: source.read(buffer_size), b''):
+            destination.write(chunk)
+            copied += len(chunk)
+        return copied
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    copied = 0
+    while True:
+        size = source.readinto(buffer)
+        if not size:
+            break
+        destination.write(view[:size])
+        copied += size
+    return copied
+
+
+def copy_file(filename, new_filename, preserve_metadata: bool = False, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Make a copy of a file (binary-safe)
+    Uses zero-copy system calls where available (Linux), falling back to a chunked copy
     :param filename: File to copy
     :type filename: str
     :param new_filename: Name of new file
     :type new_filename: str
-    :return: None
-    :rtype: None
+    :param preserve_metadata: Also copy permissions and access/modification times
+    :type preserve_metadata: bool
+    :param buffer_size: Number of bytes to copy at a time, if zero-copy is not available
+    :type buffer_size: int
+    :return: Number of bytes copied
+    :rtype: int
+    :raises shutil.SameFileError: If new_filename is the same file as filename (opening it for writing would
+    truncate the source before it is read)
     """
-    text = read_from_file(filename)
-    write_to_file(text=text, filename=new_filename)
+    if os.path.exists(new_filename) and os.path.samefile(filename, new_filename):
+        raise shutil.SameFileError(f"{filename!r} and {new_filename!r} are the same file")
+    make_path(new_filename)
+    with open(filename, 'rb') as source, open(new_filename, 'wb') as destination:
+        size = os.fstat(source.fileno()).st_size
+        copied = _kernel_copy(source_fd=source.fileno(), destination_fd=destination.fileno(), size=size)
+        if copied == 0:
+            copied = copy_file_object(source=source, destination=destination, buffer_size=buffer_size)
 
+    if preserve_metadata:
+        shutil.copystat(filename, new_filename)
 
-def save_file(file, folder: str, file_name: str = None) -> str:
+    return copied
+
+
+def _stream_to_temp_file(file, folder: str, max_size: int = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                         hash_algorithm: str = "sha256", fsync: bool = False) -> tuple[str, int, str]:
     """
-    Save a file to a specified folder with an optional file name.
-    :param file: The file object to be saved.
-    :param folder: The folder where the file will be saved.
-    :param file_name: The name of the file. If None, a random name will be used.
-    :return: The path to the saved file.
+    Stream a file object to a temporary file in a folder, hashing and counting the bytes in the same pass.
+    :param file: The file object to read from (e.g. a werkzeug FileStorage).
+    :param folder: The folder to create the temporary file in.
+    :param max_size: (Optional) Maximum number of bytes to accept.
+    :param buffer_size: Number of bytes to read at a time.
+    :param hash_algorithm: Name of any algorithm supported by hashlib.
+    :param fsync: Flush the file to disk before returning.
+    :return: The path to the temporary file, its size and its hex digest.
+    :raises FileTooLargeError: If the file is larger than max_size (the temporary file is removed).
     """
-    # Ensure the directory exists
     os.makedirs(folder, exist_ok=True)
 
+    hasher = hashlib.new(hash_algorithm)
+    temp_path = os.path.join(folder, f'.{os.urandom(16).hex()}.tmp')
+    size = 0
+    try:
+        with open(temp_path, 'xb') as f:
+            readinto = getattr(file, 'readinto', None)
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while True:
+                if readinto is not None:
+                    read = readinto(buffer)
+                    chunk = view[:read] if read else None
+                else:
+                    chunk = file.read(buffer_size)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise FileTooLargeError(max_size=max_size)
+                hasher.update(chunk)
+                f.write(chunk)
+
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return temp_path, size, hasher.hexdigest()
+
+
+def save_file_and_hash(file, folder: str, file_name: str = None, max_size: int = None,
+                       buffer_size: int = DEFAULT_BUFFER_SIZE, hash_algorithm: str = "sha256",
+                       fsync: bool = False) -> SavedFile:
+    """
+    Save a file to a specified folder with an optional file name, streaming it in fixed-size chunks.
+    The content hash and size are computed in the same pass, and the file is written to a temporary file and renamed
+    into place, so a partially-written file is never visible under its final name.
+    :param file: The file object to be saved (e.g. a werkzeug FileStorage).
+    :param folder: The folder where the file will be saved.
+    :param file_name: The name of the file. If None, a random name will be used.
+    :param max_size: (Optional) Maximum number of bytes to accept.
+    :param buffer_size: Number of bytes to read at a time.
+    :param hash_algorithm: Name of any algorithm supported by hashlib.
+    :param fsync: Flush the file to disk before renaming it into place.
+    :return: Details of the saved file.
+    :raises FileTooLargeError: If the file is larger than max_size (nothing is saved).
+    """
     # If no file name is provided, generate a random name
     file_name = file_name or os.urandom(16).hex()
 
     # Create the full path for the file
     file_path = os.path.join(folder, file_name)
 
-    # Save the file
-    with open(file_path, 'wb') as f:
-        f.write(file.read())
+    temp_path, size, content_hash = _stream_to_temp_file(file=file, folder=folder, max_size=max_size,
+                                                         buffer_size=buffer_size, hash_algorithm=hash_algorithm,
+                                                         fsync=fsync)
+    os.replace(temp_path, file_path)
+
+    return SavedFile(file_path=file_path, size=size, content_hash=content_hash, hash_algorithm=hash_algorithm)
+
+
+def save_file(file, folder: str, file_name: str = None, max_size: int = None,
+              buffer_size: int = DEFAULT_BUFFER_SIZE) -> str:
+    """
+    Save a file to a specified folder with an optional file name, streaming it in fixed-size chunks.
+    :param file: The file object to be saved.
+    :param folder: The folder where the file will be saved.
+    :param file_name: The name of the file. If None, a random name will be used.
+    :param max_size: (Optional) Maximum number of bytes to accept.
+    :param buffer_size: Number of bytes to read at a time.
+    :return: The path to the saved file.
+    :raises FileTooLargeError: If the file is larger than max_size (nothing is saved).
+    """
+    return save_file_and_hash(file=file, folder=folder, file_name=file_name, max_size=max_size,
+                              buffer_size=buffer_size).file_path
+
+
+class ContentAddressedStore:
+    """
+    Deduplicating file store, where each file is stored once under the hash of its contents.
+    Files are kept in directories sharded by hash prefix (e.g. ab/cd/abcd...), and a SQLite index counts how many times
+    each file has been stored, so it is only deleted once every reference is released.
+    """
+
+    def __init__(self, folder: str, hash_algorithm: str = "sha256", shard_depth: int = 2, shard_width: int = 2,
+                 index_path: str = None):
+        """
+        :param folder: The root folder of the store.
+        :type folder: str
+        :param hash_algorithm: Name of any algorithm supported by hashlib.
+        :type hash_algorithm: str
+        :param shard_depth: Number of nested shard directories.
+        :type shard_depth: int
+        :param shard_width: Number of hash characters per shard directory.
+        :type shard_width: int
+        :param index_path: (Optional) Path to the SQLite index. Defaults to "index.sqlite" in the root folder.
+        :type index_path: str
+        """
+        self.folder = folder
+        self.hash_algorithm = hash_algorithm
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+        self._temp_folder = os.path.join(folder, '.tmp')
+        os.makedirs(self._temp_folder, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(index_path or os.path.join(folder, 'index.sqlite'),
+                                           check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS blobs (hash TEXT PRIMARY KEY, size INTEGER NOT NULL, '
+                'ref_count INTEGER NOT NULL)')
+
+    def blob_path(self, content_hash: str) -> str:
+        """
+        Get the path a file with the given content hash is stored at.
+        :param content_hash: The hex digest of the file contents.
+        :return: The path to the stored file.
+        """
+        shards = [content_hash[i * self.shard_width:(i + 1) * self.shard_width] for i in range(self.shard_depth)]
+        return os.path.join(self.folder, *shards, content_hash)
+
+    def _add_reference(self, content_hash: str) -> Union[int, None]:
+        # Returns the size of the already-stored file, or None if it is not stored yet
+        with self._lock, self._connection:
+            # Increment first, so the row cannot be released between checking for it and counting the reference
+            updated = self._connection.execute('UPDATE blobs SET ref_count = ref_count + 1 WHERE hash = ?',
+                                               (content_hash,)).rowcount
+            if not updated:
+                return None
+            return self._connection.execute('SELECT size FROM blobs WHERE hash = ?', (content_hash,)).fetchone()[0]
+
+    def _hash_if_seekable(self, file, max_size: int = None) -> Union[str, None]:
+        try:
+            if not file.seekable():
+                return None
+            start = file.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        hasher = hashlib.new(self.hash_algorithm)
+        size = 0
+        for chunk in iter(lambda: file.read(DEFAULT_BUFFER_SIZE), b''):
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise FileTooLargeError(max_size=max_size)
+            hasher.update(chunk)
+        file.seek(start)
+        return hasher.hexdigest()
+
+    def put(self, file, max_size: int = None) -> SavedFile:
+        """
+        Store a file, unless identical content is already stored, in which case only its reference count is increased.
+        Seekable files are hashed before anything is written, so duplicates cost only a hash and an index lookup.
+        :param file: The file object to be saved (e.g. a werkzeug FileStorage).
+        :param max_size: (Optional) Maximum number of bytes to accept.
+        :return: Details of the stored file.
+        :raises FileTooLargeError: If the file is larger than max_size (nothing is saved).
+        """
+        content_hash = self._hash_if_seekable(file=file, max_size=max_size)
+        if content_hash is not None:
+            size = self._add_reference(content_hash)
+            if size is not None:
+                return SavedFile(file_path=self.blob_path(content_hash), size=size, content_hash=content_hash,
+                                 hash_algorithm=self.hash_algorithm, deduplicated=True)
+
+        temp_path, size, content_hash = _stream_to_temp_file(file=file, folder=self._temp_folder, max_size=max_size,
+                                                             hash_algorithm=self.hash_algorithm)
+        file_path = self.blob_path(content_hash)
+
+        with self._lock, self._connection:
+            # Take the write lock before checking, so another process cannot release the file in between
+            self._connection.execute('BEGIN IMMEDIATE')
+            # Another writer may have stored the same content while this one was streaming
+            exists = self._connection.execute('SELECT 1 FROM blobs WHERE hash = ?', (content_hash,)).fetchone()
+            if exists:
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                os.replace(temp_path, file_path)
+            self._connection.execute(
+                'INSERT INTO blobs (hash, size, ref_count) VALUES (?, ?, 1) '
+                'ON CONFLICT(hash) DO UPDATE SET ref_count = ref_count + 1',
+                (content_hash, size))
+
+        return SavedFile(file_path=file_path, size=size, content_hash=content_hash,
+                         hash_algorithm=self.hash_algorithm, deduplicated=bool(exists))
+
+    def put_path(self, file_path: str, max_size: int = None) -> SavedFile:
+        """
+        Store a file from disk (see put).
+        :param file_path: The path to the file to store.
+        :param max_size: (Optional) Maximum number of bytes to accept.
+        :return: Details of the stored file.
+        """
+        with open(file_path, 'rb') as f:
+            return self.put(file=f, max_size=max_size)
+
+    def get_path(self, content_hash: str) -> Union[str, None]:
+        """
+        Get the path to a stored file.
+        :param content_hash: The hex digest of the file contents.
+        :return: The path to the stored file, or None if it is not stored.
+        """
+        if not self.exists(content_hash):
+            return None
+        return self.blob_path(content_hash)
+
+    def exists(self, content_hash: str) -> bool:
+        """
+        Check if a file with the given content hash is stored.
+        :param content_hash: The hex digest of the file contents.
+        :return: True if stored, False otherwise.
+        """
+        return self.reference_count(content_hash) > 0
+
+    def reference_count(self, content_hash: str) -> int:
+        """
+        Get the number of references to a stored file.
+        :param content_hash: The hex digest of the file contents.
+        :return: The reference count (0 if not stored).
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT ref_count FROM blobs WHERE hash = ?', (content_hash,)).fetchone()
+        return row[0] if row else 0
+
+    def release(self, content_hash: str) -> bool:
+        """
+        Release one reference to a stored file, deleting the file once no references remain.
+        :param content_hash: The hex digest of the file contents.
+        :return: True if the file was deleted, False otherwise.
+        """
+        with self._lock, self._connection:
+            # Take the write lock up front, so another process cannot add a reference before the file is deleted
+            self._connection.execute('BEGIN IMMEDIATE')
+            decremented = self._connection.execute(
+                'UPDATE blobs SET ref_count = ref_count - 1 WHERE hash = ? AND ref_count > 1', (content_hash,)).rowcount
+            if decremented:
+                return False
+            if not self._connection.execute('DELETE FROM blobs WHERE hash = ?', (content_hash,)).rowcount:
+                return False
+            file_path = self.blob_path(content_hash)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            return True
+
+    def stats(self) -> dict:
+        """
+        Get the number of stored files, references, and bytes stored versus bytes referenced.
+        :return: Dictionary of statistics.
+        """
+        with self._lock:
+            files, references, stored_bytes, referenced_bytes = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(ref_count), 0), COALESCE(SUM(size), 0), '
+                'COALESCE(SUM(size * ref_count), 0) FROM blobs').fetchone()
+        return {
+            "files": files,
+            "references": references,
+            "stored_bytes": stored_bytes,
+            "referenced_bytes": referenced_bytes,
+        }
+
+    def close(self) -> None:
+        """
+        Close the index.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class DirectoryUsage:
+    """
+    Disk usage of a directory, as found by scan_directory.
+    """
+
+    def __init__(self, path: str, size_bytes: int = 0, file_count: int = 0, directory_count: int = 0):
+        """
+        :param path: The path to the directory.
+        :type path: str
+        :param size_bytes: Total size of the files counted, in bytes.
+        :type size_bytes: int
+        :param file_count: Number of files counted.
+        :type file_count: int
+        :param directory_count: Number of subdirectories counted.
+        :type directory_count: int
+        """
+        self.path = path
+        self.size_bytes = size_bytes
+        self.file_count = file_count
+        self.directory_count = directory_count
+
+    @property
+    def size(self) -> 'python8.conversions.storage.Storage':
+        """
+        Total size of the files counted, in the most readable unit.
+        :return: Storage object
+        :rtype: python8.conversions.storage.Storage
+        """
+        from python8.conversions.storage import Unit, simplify
+        return simplify(size=self.size_bytes, units=Unit.BYTES)
+
+    def add(self, other: 'DirectoryUsage') -> None:
+        """
+        Add the usage of another directory (e.g. a subdirectory) to this one.
+        :param other: Usage to add
+        :type other: DirectoryUsage
+        """
+        self.size_bytes += other.size_bytes
+        self.file_count += other.file_count
+        self.directory_count += other.directory_count
+
+
+def _matches_any(name: str, relative_path: str, patterns: List[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative_path, pattern) for pattern in patterns)
+
+
+def _directory_identity(path: str, follow_symlinks: bool) -> Union[Tuple[int, int], None]:
+    """
+    Get the (device, inode) pair identifying a directory, or None if it cannot be read.
+    """
+    try:
+        stat = os.stat(path, follow_symlinks=follow_symlinks)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _root_prefix(root: str) -> str:
+    # Paths of entries below root start with this, so slicing it off gives their path relative to root
+    return root if root.endswith(os.sep) else root + os.sep
+
+
+def _scan_entries(path: str, root_prefix: str, include: List[str], exclude: List[str],
+                  follow_symlinks: bool) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """
+    List the files (that pass the include and exclude globs) and the subdirectories (that pass the exclude globs)
+    directly inside one directory. Entries that disappear or cannot be read, and unreadable directories, are skipped.
+    """
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Only needed to match the globs
+                relative_path = entry.path[len(root_prefix):] if include or exclude else None
+                if exclude and _matches_any(entry.name, relative_path, exclude):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        subdirectories.append(entry)
+                    elif entry.is_file(follow_symlinks=follow_symlinks):
+                        if include and not _matches_any(entry.name, relative_path, include):
+                            continue
+                        files.append(entry)
+                except OSError:
+                    # The entry disappeared or cannot be read; skip it
+                    continue
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        pass
+    return files, subdirectories
+
+
+def _scan_one_directory(path: str, root_prefix: str, include: List[str], exclude: List[str],
+                        follow_symlinks: bool) -> Tuple[DirectoryUsage, List[Tuple[str, Tuple[int, int]]]]:
+    """
+    Count the files directly inside one directory, and list its subdirectories, with their identities when following
+    symbolic links (otherwise None, as a tree without followed links cannot contain cycles).
+    """
+    usage = DirectoryUsage(path=path)
+    files, directories = _scan_entries(path=path, root_prefix=root_prefix, include=include, exclude=exclude,
+                                       follow_symlinks=follow_symlinks)
+    for entry in files:
+        try:
+            usage.size_bytes += entry.stat(follow_symlinks=follow_symlinks).st_size
+        except OSError:
+            continue
+        usage.file_count += 1
+
+    subdirectories = []
+    for entry in directories:
+        identity = None
+        if follow_symlinks:
+            try:
+                stat = entry.stat(follow_symlinks=True)
+            except OSError:
+                continue
+            identity = (stat.st_dev, stat.st_ino)
+        subdirectories.append((entry.path, identity))
+        usage.directory_count += 1
+    return usage, subdirectories
+
+
+def scan_directory(root: str, include: List[str] = None, exclude: List[str] = None, max_workers: int = None,
+                   follow_symlinks: bool = False) -> Iterator[DirectoryUsage]:
+    """
+    Walk a directory tree in parallel with os.scandir, yielding the usage of each directory as soon as it is scanned.
+    Each result counts only the files directly inside that directory (see disk_usage for totals).
+    Only the directories waiting to be scanned are held in memory, not the tree, so this scales to very large trees.
+    :param root: The directory to scan.
+    :type root: str
+    :param include: (Optional) Glob patterns; only files whose name or path (relative to root) matches one are counted.
+    :type include: List[str]
+    :param exclude: (Optional) Glob patterns; files and directories whose name or relative path matches one are
+    skipped (excluded directories are not descended into).
+    :type exclude: List[str]
+    :param max_workers: (Optional) Maximum number of threads. Defaults to the ThreadPoolExecutor default.
+    :type max_workers: int
+    :param follow_symlinks: Follow symbolic links to files and directories. Directories reached more than once (e.g.
+    through a link back to a parent) are only scanned the first time.
+    :type follow_symlinks: bool
+    :return: Generator of per-directory usage, in the order directories finish scanning.
+    :rtype: Iterator[DirectoryUsage]
+    """
+    # Same default as ThreadPoolExecutor
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    # Identities of the directories already scanned or queued, to avoid symbolic link cycles
+    visited = set()
+    if follow_symlinks:
+        visited.add(_directory_identity(path=root, follow_symlinks=True))
+
+    root_prefix = _root_prefix(root)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Bound the number of queued scans, so the waiting directories are kept as plain paths
+        max_in_flight = max_workers * 2
+        # Scanned depth-first (last in, first out), so the waiting list stays proportional to the tree's depth and
+        # fan-out rather than the width of its widest level
+        waiting = [root]
+        in_flight = set()
+
+        while waiting or in_flight:
+            while waiting and len(in_flight) < max_in_flight:
+                in_flight.add(executor.submit(_scan_one_directory, waiting.pop(), root_prefix, include, exclude,
+                                              follow_symlinks))
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                usage, subdirectories = future.result()
+                for path, identity in subdirectories:
+                    if identity is not None:
+                        if identity in visited:
+                            continue
+                        visited.add(identity)
+                    waiting.append(path)
+                yield usage
+
+
+def disk_usage(root: str, include: List[str] = None, exclude: List[str] = None, depth: int = 0,
+               max_workers: int = None, follow_symlinks: bool = False) -> Dict[str, DirectoryUsage]:
+    """
+    Total the disk usage of a directory tree, scanning it in parallel.
+    :param root: The directory to scan.
+    :type root: str
+    :param include: (Optional) Glob patterns; only files whose name or path (relative to root) matches one are counted.
+    :type include: List[str]
+    :param exclude: (Optional) Glob patterns; files and directories whose name or relative path matches one are
+    skipped.
+    :type exclude: List[str]
+    :param depth: Also total each directory up to this many levels below root (0 for only the root).
+    :type depth: int
+    :param max_workers: (Optional) Maximum number of threads. Defaults to the ThreadPoolExecutor default.
+    :type max_workers: int
+    :param follow_symlinks: Follow symbolic links to files and directories.
+    :type follow_symlinks: bool
+    :return: Dictionary of directory path to its recursive usage (root included)
+    :rtype: Dict[str, DirectoryUsage]
+    """
+    root = os.path.normpath(root)
+    totals = {root: DirectoryUsage(path=root)}
+
+    for usage in scan_directory(root=root, include=include, exclude=exclude, max_workers=max_workers,
+                                follow_symlinks=follow_symlinks):
+        relative_parts = [] if usage.path == root else os.path.relpath(usage.path, root).split(os.sep)
+        # Add to the root, and to each ancestor (including itself) within the requested depth
+        totals[root].add(usage)
+        for level in range(1, min(depth, len(relative_parts)) + 1):
+            ancestor = os.path.join(root, *relative_parts[:level])
+            totals.setdefault(ancestor, DirectoryUsage(path=ancestor)).add(usage)
+
+    return totals
+
+
+def _iter_files(root: str, include: List[str] = None, exclude: List[str] = None) -> Iterator[os.DirEntry]:
+    """
+    Walk a directory tree with os.scandir, yielding the files that pass the include and exclude globs.
+    """
+    root_prefix = _root_prefix(root)
+    waiting = [root]
+    while waiting:
+        files, subdirectories = _scan_entries(path=waiting.pop(), root_prefix=root_prefix, include=include,
+                                              exclude=exclude, follow_symlinks=False)
+        waiting.extend(entry.path for entry in subdirectories)
+        yield from files
+
+
+# Marks a file that was not in the previous snapshot (distinct from None, a file recorded without a hash)
+_NEW_FILE = object()
+
+
+class ManifestChanges:
+    """
+    Files added, modified and deleted since the previous snapshot of a FileManifest (paths relative to its root).
+    """
+
+    def __init__(self, added: List[str] = None, modified: List[str] = None, deleted: List[str] = None,
+                 unchanged: int = 0):
+        """
+        :param added: Files that were not in the previous snapshot.
+        :type added: List[str]
+        :param modified: Files whose content changed (or whose size or mtime changed, if contents are not hashed).
+        :type modified: List[str]
+        :param deleted: Files that were in the previous snapshot, but no longer exist.
+        :type deleted: List[str]
+        :param unchanged: Number of files that did not change.
+        :type unchanged: int
+        """
+        self.added = added or []
+        self.modified = modified or []
+        self.deleted = deleted or []
+        self.unchanged = unchanged
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+
+class FileManifest:
+    """
+    Index of the files in a directory tree (path, size, mtime and optionally a content hash), kept in SQLite.
+    Each snapshot compares the tree to the previous one, and only hashes files whose size or mtime changed.
+    """
+
+    # Number of changed files hashed together on the thread pool
+    _HASH_BATCH_SIZE = 256
+
+    def __init__(self, root: str, index_path: str = None, hash_algorithm: str = None, include: List[str] = None,
+                 exclude: List[str] = None, max_workers: int = None):
+        """
+        :param root: The directory to index.
+        :type root: str
+        :param index_path: (Optional) Path to the SQLite index. Defaults to ".manifest.sqlite" in the root directory.
+        :type index_path: str
+        :param hash_algorithm: (Optional) Name of any algorithm supported by hashlib, to also compare file contents.
+        Files whose size or mtime changed but whose hash did not are then not reported as modified.
+        :type hash_algorithm: str
+        :param include: (Optional) Glob patterns; only files whose name or relative path matches one are indexed.
+        :type include: List[str]
+        :param exclude: (Optional) Glob patterns; files and directories whose name or relative path matches one are
+        skipped. The index file itself is always skipped.
+        :type exclude: List[str]
+        :param max_workers: (Optional) Maximum number of threads used to hash files.
+        :type max_workers: int
+        """
+        self.root = os.path.normpath(root)
+        self.index_path = index_path or os.path.join(self.root, '.manifest.sqlite')
+        self.hash_algorithm = hash_algorithm
+        self.include = include
+        self.exclude = list(exclude or [])
+        self.max_workers = max_workers
+
+        index_name = os.path.basename(self.index_path)
+        self.exclude.extend([index_name, f"{index_name}-wal", f"{index_name}-shm", f"{index_name}-journal"])
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.index_path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER NOT NULL, '
+                'mtime_ns INTEGER NOT NULL, hash TEXT, snapshot INTEGER NOT NULL)')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS files_snapshot ON files (snapshot)')
+
+    def _hash_and_compare(self, candidates: List[tuple], snapshot: int, changes: ManifestChanges) -> None:
+        """
+        Hash a batch of new or changed files, record them, and sort them into added, modified and unchanged.
+        """
+        hashes = {}
+        if self.hash_algorithm:
+            from python8.core import crypto
+            hashes = crypto.hash_files([os.path.join(self.root, path) for path, *_ in candidates],
+                                       algorithm=self.hash_algorithm, max_workers=self.max_workers)
+
+        rows = []
+        for path, size, mtime_ns, previous_hash in candidates:
+            content_hash = hashes.get(os.path.join(self.root, path))
+            rows.append((path, size, mtime_ns, content_hash, snapshot))
+            if previous_hash is _NEW_FILE:
+                changes.added.append(path)
+            elif content_hash is not None and content_hash == previous_hash:
+                changes.unchanged += 1
+            else:
+                changes.modified.append(path)
+
+        self._connection.executemany(
+            'REPLACE INTO files (path, size, mtime_ns, hash, snapshot) VALUES (?, ?, ?, ?, ?)', rows)
+
+    def snapshot(self, dry_run: bool = False) -> ManifestChanges:
+        """
+        Compare the directory tree to the previous snapshot, and record the new state.
+        Files are streamed from the tree, so memory use grows with the number of changes, not the number of files.
+        :param dry_run: Report the changes without recording them.
+        :type dry_run: bool
+        :return: Files added, modified and deleted since the previous snapshot.
+        :rtype: ManifestChanges
+        """
+        changes = ManifestChanges()
+        with self._lock:
+            try:
+                snapshot = self._connection.execute('SELECT COALESCE(MAX(snapshot), 0) + 1 FROM files').fetchone()[0]
+                candidates = []
+                for entry in _iter_files(self.root, include=self.include, exclude=self.exclude):
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    path = os.path.relpath(entry.path, self.root)
+                    row = self._connection.execute('SELECT size, mtime_ns, hash FROM files WHERE path = ?',
+                                                   (path,)).fetchone()
+                    if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+                        self._connection.execute('UPDATE files SET snapshot = ? WHERE path = ?', (snapshot, path))
+                        changes.unchanged += 1
+                        continue
+
+                    previous_hash = _NEW_FILE if row is None else row[2]
+                    candidates.append((path, stat.st_size, stat.st_mtime_ns, previous_hash))
+                    if len(candidates) >= self._HASH_BATCH_SIZE:
+                        self._hash_and_compare(candidates=candidates, snapshot=snapshot, changes=changes)
+                        candidates = []
+                if candidates:
+                    self._hash_and_compare(candidates=candidates, snapshot=snapshot, changes=changes)
+
+                changes.deleted = [path for (path,) in self._connection.execute(
+                    'SELECT path FROM files WHERE snapshot < ?', (snapshot,))]
+                self._connection.execute('DELETE FROM files WHERE snapshot < ?', (snapshot,))
+            except BaseException:
+                self._connection.rollback()
+                raise
+
+            if dry_run:
+                self._connection.rollback()
+            else:
+                self._connection.commit()
+        return changes
+
+    def get(self, path: str) -> Union[dict, None]:
+        """
+        Get the recorded size, mtime and hash of a file.
+        :param path: Path to the file, relative to the root.
+        :type path: str
+        :return: Dictionary with "size", "mtime_ns" and "hash", or None if the file is not in the index.
+        :rtype: Union[dict, None]
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT size, mtime_ns, hash FROM files WHERE path = ?',
+                                           (path,)).fetchone()
+        if row is None:
+            return None
+        return {"size": row[0], "mtime_ns": row[1], "hash": row[2]}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the index.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'FileManifest':
+        return self
 
-    return file_path
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
 
 def delete_file(file_path: str) -> None:
@@ -0,0 +1,246 @@
+"""
+JSON serialization through the fastest available backend: orjson, then ujson, then the standard library.
+
+Fast backends are only used for parsing and compact serialization. Indented output and objects a fast backend
+cannot handle always fall back to the standard library.
+
+orjson is configured to hand datetimes, dataclasses and subclasses of built-in types to default (or to the standard
+library) like the standard library does. Non-string keys and non-finite floats (NaN and infinities, which orjson would
+write as null) are also left to the standard library. One difference remains: orjson serializes UUID and Enum objects
+natively (as str(uuid) and the enum's value) without calling default, where the standard library would call default
+(or raise TypeError without one).
+"""
+import json
+import math
+from typing import Any, Callable, IO, List, Union
+
+STDLIB_BACKEND = "json"
+ORJSON_BACKEND = "orjson"
+UJSON_BACKEND = "ujson"
+
+_BACKEND_PREFERENCE = [ORJSON_BACKEND, UJSON_BACKEND, STDLIB_BACKEND]
+
+_backend_name: str = STDLIB_BACKEND
+_backend_module = json
+
+
+def _import_backend(name: str):
+    if name == STDLIB_BACKEND:
+        return json
+    try:
+        return __import__(name)
+    except ImportError:
+        return None
+
+
+def set_backend(name: str = None) -> str:
+    """
+    Select the JSON backend to use.
+    :param name: "orjson", "ujson" or "json". If None, use the fastest installed backend.
+    :type name: str
+    :return: Name of the selected backend.
+    :rtype: str
+    """
+    global _backend_name, _backend_module
+    candidates = [name] if name else _BACKEND_PREFERENCE
+    for candidate in candidates:
+        module = _import_backend(candidate)
+        if module is not None:
+            _backend_name, _backend_module = candidate, module
+            return candidate
+    raise ImportError(f'JSON backend "{name}" is not installed')
+
+
+def get_backend() -> str:
+    """
+    Get the name of the JSON backend in use.
+    :return: "orjson", "ujson" or "json"
+    :rtype: str
+    """
+    return _backend_name
+
+
+def available_backends() -> List[str]:
+    """
+    Get the names of every installed JSON backend, fastest first.
+    :return: List of backend names
+    :rtype: List[str]
+    """
+    return [name for name in _BACKEND_PREFERENCE if _import_backend(name) is not None]
+
+
+def _stdlib_dumps(obj: Any, indent: int, sort_keys: bool, compact: bool, default: Callable) -> str:
+    separators = (',', ':') if compact else None
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys, separators=separators, default=default)
+
+
+# Types the standard library serializes itself, including their subclasses (which orjson passes to default instead)
+_STDLIB_NATIVE_TYPES = (str, int, float, list, tuple, dict)
+
+
+class _OrjsonDefault:
+    """
+    default function for orjson, which also records whether it was called.
+    """
+
+    def __init__(self, default: Union[Callable, None]):
+        self.default = default
+        self.called = False
+
+    def __call__(self, obj):
+        # Raising makes dumps fall back to the standard library, which serializes these without calling default
+        if self.default is None or isinstance(obj, _STDLIB_NATIVE_TYPES):
+            raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+        self.called = True
+        return self.default(obj)
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    pending = [obj]
+    while pending:
+        item = pending.pop()
+        item_type = type(item)
+        if item_type is float:
+            if not math.isfinite(item):
+                return True
+        elif item_type is dict:
+            pending.extend(item.values())
+        elif item_type is list or item_type is tuple:
+            pending.extend(item)
+    return False
+
+
+def _orjson_option(sort_keys: bool) -> int:
+    # Without the passthrough options, orjson serializes these types itself and never calls default
+    option = (_backend_module.OPT_PASSTHROUGH_DATETIME
+              | _backend_module.OPT_PASSTHROUGH_DATACLASS
+              | _backend_module.OPT_PASSTHROUGH_SUBCLASS)
+    if sort_keys:
+        option |= _backend_module.OPT_SORT_KEYS
+    return option
+
+
+def _orjson_dumps(obj: Any, sort_keys: bool, default: Union[Callable, None]) -> Union[bytes, None]:
+    """
+    Serialize with orjson, or return None if the standard library must be used instead.
+    """
+    orjson_default = _OrjsonDefault(default)
+    try:
+        result = _backend_module.dumps(obj, default=orjson_default, option=_orjson_option(sort_keys))
+    except (TypeError, ValueError, OverflowError):
+        # e.g. integers larger than 64 bits, non-string keys; let the standard library decide
+        return None
+    # orjson writes NaN and infinities as null, where the standard library writes NaN and Infinity. Only look for them
+    # when the output has a null, and give up if default was called (its results cannot be checked)
+    if b'null' in result and (orjson_default.called or _has_non_finite_float(obj)):
+        return None
+    return result
+
+
+def dumps(obj: Any, indent: int = None, sort_keys: bool = False, compact: bool = False,
+          default: Callable = None) -> str:
+    """
+    Serialize an object to a JSON string.
+    :param obj: Object to serialize
+    :type obj: Any
+    :param indent: (Optional) Indentation level. Indented output always uses the standard library.
+    :type indent: int, optional
+    :param sort_keys: (Optional) Sort dictionary keys (Default: False)
+    :type sort_keys: bool, optional
+    :param compact: (Optional) Omit whitespace after separators. Compact output uses the fast backend, if available.
+    :type compact: bool, optional
+    :param default: (Optional) Function to convert objects that are not natively serializable
+    :type default: Callable, optional
+    :return: JSON string
+    :rtype: str
+    """
+    if compact and indent is None and _backend_name != STDLIB_BACKEND:
+        if _backend_name == ORJSON_BACKEND:
+            result = _orjson_dumps(obj, sort_keys=sort_keys, default=default)
+            if result is not None:
+                return result.decode('utf-8')
+        else:
+            try:
+                # ujson raises OverflowError for NaN and infinities, so those also fall back
+                return _backend_module.dumps(obj, sort_keys=sort_keys, escape_forward_slashes=False, default=default)
+            except (TypeError, ValueError, OverflowError):
+                # e.g. integers larger than 64 bits, unsupported key types; let the standard library decide
+                pass
+    return _stdlib_dumps(obj, indent=indent, sort_keys=sort_keys, compact=compact, default=default)
+
+
+def dumps_bytes(obj: Any, indent: int = None, sort_keys: bool = False, compact: bool = False,
+                default: Callable = None) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+    :param obj: Object to serialize
+    :type obj: Any
+    :param indent: (Optional) Indentation level. Indented output always uses the standard library.
+    :type indent: int, optional
+    :param sort_keys: (Optional) Sort dictionary keys (Default: False)
+    :type sort_keys: bool, optional
+    :param compact: (Optional) Omit whitespace after separators. Compact output uses the fast backend, if available.
+    :type compact: bool, optional
+    :param default: (Optional) Function to convert objects that are not natively serializable
+    :type default: Callable, optional
+    :return: JSON bytes
+    :rtype: bytes
+    """
+    if compact and indent is None and _backend_name == ORJSON_BACKEND:
+        result = _orjson_dumps(obj, sort_keys=sort_keys, default=default)
+        if result is not None:
+            return result
+    return dumps(obj, indent=indent, sort_keys=sort_keys, compact=compact, default=default).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON string or bytes.
+    :param data: JSON string or bytes
+    :type data: Union[str, bytes]
+    :return: Deserialized object
+    :rtype: Any
+    """
+    if _backend_name != STDLIB_BACKEND:
+        try:
+            return _backend_module.loads(data)
+        except ValueError:
+            # Fast backends reject some inputs the standard library accepts (e.g. NaN, very large integers)
+            pass
+    return json.loads(data)
+
+
+def load(file: IO) -> Any:
+    """
+    Deserialize JSON from a file object.
+    :param file: File object opened for reading
+    :type file: IO
+    :return: Deserialized object
+    :rtype: Any
+    """
+    return loads(file.read())
+
+
+def dump(obj: Any, file: IO[str], indent: int = None, sort_keys: bool = False, compact: bool = False,
+         default: Callable = None) -> None:
+    """
+    Serialize an object as JSON to a text file object.
+    :param obj: Object to serialize
+    :type obj: Any
+    :param file: File object opened for writing text
+    :type file: IO[str]
+    :param indent: (Optional) Indentation level. Indented output always uses the standard library.
+    :type indent: int, optional
+    :param sort_keys: (Optional) Sort dictionary keys (Default: False)
+    :type sort_keys: bool, optional
+    :param compact: (Optional) Omit whitespace after separators. Compact output uses the fast backend, if available.
+    :type compact: bool, optional
+    :param default: (Optional) Function to convert objects that are not natively serializable
+    :type default: Callable, optional
+    :return: None
+    :rtype: None
+    """
+    file.write(dumps(obj, indent=indent, sort_keys=sort_keys, compact=compact, default=default))
+
+
+set_backend()
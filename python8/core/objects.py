@@ -1,38 +1,365 @@
+import functools
+import hashlib
+import io
+import mmap
+import os
 import pickle
-from typing import Union
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
-from python8.core.dictionaries import save_dict_to_sqlite, load_dict_from_sqlite
+from python8.core.serializers import Serializer, get_serializer
+from python8.core.sqlite_dict import DEFAULT_TABLE_NAME, LazySQLiteDict
 
+# Marks serialized bytes that were compressed by ObjectStore (pickle, JSON and marshal never start with a null byte)
+_ZLIB_PREFIX = b'\x00python8:zlib\x00'
 
-def object_to_pickle(obj: object) -> Union[bytes, None]:
+# Marks a framed pickle, with out-of-band buffers and/or compression (see object_to_pickle)
+_FRAMED_MAGIC = b'\x00p8pkl5\x00'
+_FRAMED_HEADER = struct.Struct('<8sB')
+_FRAMED_COUNTS = struct.Struct('<IQ')
+_FRAMED_BUFFER = struct.Struct('<QB')
+
+# Compression codecs for framed pickles, and their IDs in the header
+COMPRESSION_CODECS = {
+    'zlib': 1,
+    'zstd': 2,
+    'lz4': 3,
+}
+
+# Payloads (pickle stream plus buffers) smaller than this are not compressed (1 MiB)
+DEFAULT_COMPRESSION_THRESHOLD = 1024 * 1024
+
+# bytes and bytearray objects of at least this size are written out-of-band (64 KiB)
+DEFAULT_OUT_OF_BAND_THRESHOLD = 64 * 1024
+
+# Header of a SharedObject file: magic and version, followed by a framed pickle
+_SHARED_HEADER = struct.Struct('<8sQ')
+_SHARED_MAGIC = b'p8shobj\x00'
+
+# Batches smaller than this are (un)pickled in-process, where a process pool's overhead would outweigh the gain
+DEFAULT_MIN_PARALLEL_BATCH_SIZE = 64
+
+# Amount of data fed to a compressor or read from a file at a time (1 MiB)
+_CHUNK_SIZE = 1024 * 1024
+
+
+# region Framed pickles
+
+# Kinds of out-of-band buffer in a framed pickle
+_BUFFER_PICKLE = 0
+_BUFFER_BYTES = 1
+_BUFFER_BYTEARRAY = 2
+
+
+class _OutOfBandPickler(pickle.Pickler):
+    """
+    Protocol 5 pickler that collects out-of-band buffers: those of objects that support PickleBuffer (such as NumPy
+    arrays), and large bytes and bytearray objects (which pickle itself always writes in-band).
+    """
+
+    def __init__(self, file: BinaryIO, threshold: int):
+        buffers: List[Tuple[memoryview, int]] = []
+        # Not a bound method, which would make the pickler reference itself: the cycle would then only be freed by the
+        # garbage collector, which cannot safely clear memoryviews that still export buffers (and crashes)
+        super().__init__(file, protocol=5,
+                         buffer_callback=lambda buffer: buffers.append((buffer.raw(), _BUFFER_PICKLE)))
+        self.threshold = threshold
+        self.buffers = buffers
+        # Persistent IDs bypass pickle's memo, so shared references are tracked here (the memoryviews keep the objects
+        # alive, so their ids cannot be reused)
+        self._buffer_ids: Dict[int, int] = {}
+
+    def persistent_id(self, obj):
+        # Called for every object, before pickle's own handling of bytes and bytearray
+        obj_type = type(obj)
+        if (obj_type is bytes or obj_type is bytearray) and len(obj) >= self.threshold:
+            index = self._buffer_ids.get(id(obj))
+            if index is None:
+                index = self._buffer_ids[id(obj)] = len(self.buffers)
+                self.buffers.append((memoryview(obj), _BUFFER_BYTES if obj_type is bytes else _BUFFER_BYTEARRAY))
+            return index
+        return None
+
+
+class _OutOfBandUnpickler(pickle.Unpickler):
+    """
+    Unpickler for the body of a framed pickle, given its out-of-band buffers.
+    """
+
+    def __init__(self, file: BinaryIO, buffers: List[Tuple[memoryview, int]]):
+        super().__init__(file, buffers=[buffer for buffer, kind in buffers if kind == _BUFFER_PICKLE])
+        self._buffers = buffers
+        self._loaded: Dict[int, Union[bytes, bytearray]] = {}
+
+    def persistent_load(self, pid):
+        if pid in self._loaded:
+            return self._loaded[pid]
+        buffer, kind = self._buffers[pid]
+        if kind == _BUFFER_BYTES:
+            obj = bytes(buffer)
+        elif kind == _BUFFER_BYTEARRAY:
+            obj = bytearray(buffer)
+        else:
+            raise pickle.UnpicklingError(f"Invalid buffer reference {pid!r}")
+        self._loaded[pid] = obj
+        return obj
+
+
+def _zstd_module():
+    try:
+        # Standard library from Python 3.14
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd compression requires the zstandard package (pip install zstandard)")
+    return zstandard
+
+
+class _LZ4Compressor:
+    """
+    lz4.frame compressor with the same compress/flush interface as zlib's.
+    """
+
+    def __init__(self, level: int = None):
+        import lz4.frame
+        self._compressor = lz4.frame.LZ4FrameCompressor(compression_level=level or 0)
+        self._header = self._compressor.begin()
+
+    def compress(self, data) -> bytes:
+        header, self._header = self._header, b''
+        return header + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        header, self._header = self._header, b''
+        return header + self._compressor.flush()
+
+
+def _compressor(codec: str, level: int = None):
+    if codec == 'zlib':
+        return zlib.compressobj(level if level is not None else 6)
+    if codec == 'zstd':
+        zstd = _zstd_module()
+        if zstd.__name__ != 'zstandard':
+            return zstd.ZstdCompressor(level=level)
+        return zstd.ZstdCompressor(level=level if level is not None else 3).compressobj()
+    if codec == 'lz4':
+        return _LZ4Compressor(level=level)
+    raise ValueError(f"Unknown compression codec {codec!r}")
+
+
+def _decompressor(codec: str):
+    if codec == 'zlib':
+        return zlib.decompressobj()
+    if codec == 'zstd':
+        zstd = _zstd_module()
+        if zstd.__name__ != 'zstandard':
+            return zstd.ZstdDecompressor()
+        return zstd.ZstdDecompressor().decompressobj()
+    if codec == 'lz4':
+        import lz4.frame
+        return lz4.frame.LZ4FrameDecompressor()
+    raise ValueError(f"Unknown compression codec {codec!r}")
+
+
+def available_compression_codecs() -> List[str]:
+    """
+    Get the compression codecs that can be used, in order of preference for compression='auto'.
+    :return: Names of the installed codecs.
+    :rtype: List[str]
+    """
+    codecs = []
+    try:
+        _zstd_module()
+        codecs.append('zstd')
+    except ImportError:
+        pass
+    try:
+        import lz4.frame  # noqa: F401
+        codecs.append('lz4')
+    except ImportError:
+        pass
+    codecs.append('zlib')
+    return codecs
+
+
+def _dump_segments(obj: object, protocol: int = None, out_of_band: bool = False,
+                   out_of_band_threshold: int = DEFAULT_OUT_OF_BAND_THRESHOLD) -> Tuple[bytes, List[Tuple]]:
+    """
+    Pickle an object into its pickle stream and (if out_of_band) a list of out-of-band buffers and their kinds.
+    """
+    if not out_of_band:
+        return pickle.dumps(obj, protocol=protocol), []
+    stream = io.BytesIO()
+    pickler = _OutOfBandPickler(stream, threshold=out_of_band_threshold)
+    pickler.dump(obj)
+    return stream.getvalue(), pickler.buffers
+
+
+def _write_framed(write: Callable, data: bytes, buffers: List[Tuple], codec: Union[str, None],
+                  compression_level: int = None) -> None:
+    """
+    Write a pickle stream and its out-of-band buffers as a framed pickle.
+    Buffers are written directly from the memory of the objects they belong to, without copying them.
+    """
+    write(_FRAMED_HEADER.pack(_FRAMED_MAGIC, COMPRESSION_CODECS[codec] if codec else 0))
+
+    parts = [_FRAMED_COUNTS.pack(len(buffers), len(data)), data]
+    for buffer, kind in buffers:
+        parts.append(_FRAMED_BUFFER.pack(buffer.nbytes, kind))
+        parts.append(buffer)
+
+    if not codec:
+        for part in parts:
+            write(part)
+        return
+
+    compressor = _compressor(codec, level=compression_level)
+    for part in parts:
+        view = memoryview(part)
+        for start in range(0, len(view), _CHUNK_SIZE):
+            compressed = compressor.compress(view[start:start + _CHUNK_SIZE])
+            if compressed:
+                write(compressed)
+    write(compressor.flush())
+
+
+def _read_framed_body(body: Union[memoryview, bytearray]) -> object:
+    """
+    Unpickle the body of a framed pickle. Out-of-band buffers are passed to pickle as slices of the body, not copies
+    (bytes and bytearray objects are copied out of them, as they cannot share memory).
+    """
+    body = memoryview(body)
+    buffer_count, data_length = _FRAMED_COUNTS.unpack_from(body, 0)
+    offset = _FRAMED_COUNTS.size
+    data = body[offset:offset + data_length]
+    offset += data_length
+
+    buffers = []
+    for _ in range(buffer_count):
+        length, kind = _FRAMED_BUFFER.unpack_from(body, offset)
+        offset += _FRAMED_BUFFER.size
+        buffers.append((body[offset:offset + length], kind))
+        offset += length
+    return _OutOfBandUnpickler(io.BytesIO(data), buffers=buffers).load()
+
+
+def _decompress_chunks(codec_id: int, chunks: Iterable) -> bytearray:
+    codec = next(name for name, value in COMPRESSION_CODECS.items() if value == codec_id)
+    decompressor = _decompressor(codec)
+    body = bytearray()
+    for chunk in chunks:
+        body += decompressor.decompress(chunk)
+    if hasattr(decompressor, 'flush'):
+        body += decompressor.flush()
+    return body
+
+
+def _choose_codec(compression: Union[str, None], size: int, threshold: int) -> Union[str, None]:
+    if not compression or size < threshold:
+        return None
+    if compression == 'auto':
+        return available_compression_codecs()[0]
+    if compression not in COMPRESSION_CODECS:
+        raise ValueError(f"Unknown compression codec {compression!r}")
+    return compression
+
+# endregion
+
+
+def object_to_pickle(obj: object, protocol: int = None, out_of_band: bool = False, compression: str = None,
+                     compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD, compression_level: int = None,
+                     out_of_band_threshold: int = DEFAULT_OUT_OF_BAND_THRESHOLD) -> Union[bytes, None]:
     """
     Pickle an object and return the pickled bytes.
+    With out_of_band or compression, the result is a framed pickle (which pickle_to_object also reads) rather than a
+    plain pickle stream.
     :param obj: The object to pickle.
     :type obj: object
+    :param protocol: (Optional) The pickle protocol to use. Defaults to pickle.DEFAULT_PROTOCOL.
+    :type protocol: int
+    :param out_of_band: Use protocol 5, and keep large buffers (NumPy arrays, large bytes and bytearray objects, and
+    anything else that supports PickleBuffer) out of the pickle stream.
+    :type out_of_band: bool
+    :param compression: (Optional) Compression codec: "zlib", "zstd" (needs zstandard before Python 3.14), "lz4"
+    (needs lz4), or "auto" for the best one installed.
+    :type compression: str
+    :param compression_threshold: Only compress payloads of at least this many bytes.
+    :type compression_threshold: int
+    :param compression_level: (Optional) Compression level. Defaults to the codec's default.
+    :type compression_level: int
+    :param out_of_band_threshold: Minimum size of bytes and bytearray objects to keep out of the pickle stream.
+    :type out_of_band_threshold: int
     :return: Pickled object.
     :rtype: Union[bytes, None]
     """
     try:
-        return pickle.dumps(obj)
+        if not out_of_band and not compression:
+            return pickle.dumps(obj, protocol=protocol)
+        data, buffers = _dump_segments(obj, protocol=protocol, out_of_band=out_of_band,
+                                       out_of_band_threshold=out_of_band_threshold)
     except pickle.PicklingError:
         return None
 
+    codec = _choose_codec(compression, size=len(data) + sum(buffer.nbytes for buffer, _ in buffers),
+                          threshold=compression_threshold)
+    parts = []
+    _write_framed(parts.append, data=data, buffers=buffers, codec=codec, compression_level=compression_level)
+    return b''.join(parts)
+
 
-def object_to_pickle_file(obj: object, file_path: str) -> None:
+def object_to_pickle_file(obj: object, file_path: str, protocol: int = None, out_of_band: bool = False,
+                          compression: str = None, compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+                          compression_level: int = None,
+                          out_of_band_threshold: int = DEFAULT_OUT_OF_BAND_THRESHOLD) -> None:
     """
     Pickle an object and write it to a file.
+    With out_of_band, large buffers are written to the file straight from the objects' memory, and
+    pickle_file_to_object maps them back from the file (see there). With compression, the file is compressed as it
+    is written.
     :param obj: The object to pickle.
     :type obj: object
     :param file_path: The file path to write the pickled object to.
-    :type obj: object
+    :type file_path: str
+    :param protocol: (Optional) The pickle protocol to use. Defaults to pickle.DEFAULT_PROTOCOL.
+    :type protocol: int
+    :param out_of_band: Use protocol 5, and keep large buffers out of the pickle stream (see object_to_pickle).
+    :type out_of_band: bool
+    :param compression: (Optional) Compression codec: "zlib", "zstd", "lz4", or "auto" for the best one installed.
+    :type compression: str
+    :param compression_threshold: Only compress payloads of at least this many bytes.
+    :type compression_threshold: int
+    :param compression_level: (Optional) Compression level. Defaults to the codec's default.
+    :type compression_level: int
+    :param out_of_band_threshold: Minimum size of bytes and bytearray objects to keep out of the pickle stream.
+    :type out_of_band_threshold: int
     :return: None
     :rtype: None
     """
     try:
-        with open(file_path, 'wb') as f:
-            pickle.dump(obj, f)
+        if not out_of_band and not compression:
+            with open(file_path, 'wb') as f:
+                pickle.dump(obj, f, protocol=protocol)
+            return
+        data, buffers = _dump_segments(obj, protocol=protocol, out_of_band=out_of_band,
+                                       out_of_band_threshold=out_of_band_threshold)
     except pickle.PicklingError:
-        pass
+        return
+
+    codec = _choose_codec(compression, size=len(data) + sum(buffer.nbytes for buffer, _ in buffers),
+                          threshold=compression_threshold)
+    with open(file_path, 'wb') as f:
+        _write_framed(f.write, data=data, buffers=buffers, codec=codec, compression_level=compression_level)
 
 
 def save_object_to_sqlite(name: str, obj: object, db_path: str) -> None:
@@ -47,20 +374,30 @@ def save_object_to_sqlite(name: str, obj: object, db_path: str) -> None:
     :return: None
     :rtype: None
     """
-    data = object_to_pickle(obj)
-    save_dict_to_sqlite(dictionary={name: data}, file_path=db_path)
+    with ObjectStore(db_path=db_path, journal_mode=None) as store:
+        store.put(name=name, obj=obj)
 
 
 def pickle_to_object(pickled_obj: bytes) -> Union[object, None]:
     """
     Unpickle an object from the pickled bytes.
+    Framed pickles (from object_to_pickle with out_of_band or compression) are detected automatically; their
+    out-of-band buffers reference pickled_obj rather than being copied.
     :param pickled_obj: The pickled object.
     :type pickled_obj: bytes
     :return: Unpickled object.
     :rtype: Union[object, None]
     """
     try:
-        return pickle.loads(pickled_obj)
+        if pickled_obj[:len(_FRAMED_MAGIC)] != _FRAMED_MAGIC:
+            return pickle.loads(pickled_obj)
+        view = memoryview(pickled_obj)
+        codec_id = view[len(_FRAMED_MAGIC)]
+        body = view[_FRAMED_HEADER.size:]
+        if codec_id:
+            body = _decompress_chunks(codec_id, (body[start:start + _CHUNK_SIZE]
+                                                 for start in range(0, len(body), _CHUNK_SIZE)))
+        return _read_framed_body(body)
     except pickle.UnpicklingError:
         return None
 
@@ -68,6 +405,9 @@ def pickle_to_object(pickled_obj: bytes) -> Union[object, None]:
 def pickle_file_to_object(file_path: str) -> Union[object, None]:
     """
     Unpickle an object from a file.
+    Framed pickles (from object_to_pickle_file with out_of_band or compression) are detected automatically.
+    Uncompressed ones are memory-mapped (copy-on-write), so objects that support PickleBuffer (such as NumPy arrays)
+    use the mapped pages directly instead of being copied into memory.
     :param file_path: The file path to read the pickled object from.
     :type file_path: str
     :return: Unpickled object.
@@ -75,11 +415,134 @@ def pickle_file_to_object(file_path: str) -> Union[object, None]:
     """
     try:
         with open(file_path, 'rb') as f:
-            return pickle.load(f)
+            magic, codec_id = _FRAMED_HEADER.unpack(f.read(_FRAMED_HEADER.size).ljust(_FRAMED_HEADER.size, b'\0'))
+            if magic != _FRAMED_MAGIC:
+                f.seek(0)
+                return pickle.load(f)
+            if codec_id:
+                return _read_framed_body(_decompress_chunks(codec_id, iter(lambda: f.read(_CHUNK_SIZE), b'')))
+            # The map stays open for as long as any unpickled object references it
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        return _read_framed_body(memoryview(mapped)[_FRAMED_HEADER.size:])
     except pickle.UnpicklingError:
         return None
 
 
+def _pickle_chunk(objs: List[object], options: dict) -> List[Union[bytes, None]]:
+    pickled_objs = []
+    for obj in objs:
+        try:
+            pickled_objs.append(object_to_pickle(obj, **options))
+        except (TypeError, AttributeError):
+            # e.g. locks and local functions, which pickle rejects with TypeError or AttributeError
+            pickled_objs.append(None)
+    return pickled_objs
+
+
+def _unpickle_chunk(pickled_objs: List[bytes]) -> List[Union[object, None]]:
+    return [pickle_to_object(pickled_obj) for pickled_obj in pickled_objs]
+
+
+def _is_compressed_pickle(pickled_obj: bytes) -> bool:
+    return pickled_obj[:len(_FRAMED_MAGIC)] == _FRAMED_MAGIC and pickled_obj[len(_FRAMED_MAGIC)] != 0
+
+
+def _map_in_chunks(func: Callable, items: List, parallel: bool, max_workers: int = None, chunk_size: int = None,
+                   min_parallel_batch_size: int = DEFAULT_MIN_PARALLEL_BATCH_SIZE,
+                   executor: ProcessPoolExecutor = None) -> List:
+    """
+    Apply a function (that takes and returns a list) to a list in chunks on a process pool, keeping the input order.
+    Small batches, a single worker, or parallel=False are processed in-process instead. A chunk that fails in the
+    pool (e.g. because an item cannot be sent to a worker) is redone in-process, so the result does not depend on
+    the number of workers.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if not parallel or len(items) < min_parallel_batch_size or workers <= 1:
+        return func(items)
+
+    # Several chunks per worker, so a slow chunk does not leave the others idle
+    chunk_size = chunk_size or max(1, -(-len(items) // (workers * 4)))
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(func, chunk) for chunk in chunks]
+        results = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                results.extend(future.result())
+            except Exception:
+                results.extend(func(chunk))
+        return results
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def objects_to_pickles(objs: Iterable[object], max_workers: int = None, chunk_size: int = None,
+                       min_parallel_batch_size: int = DEFAULT_MIN_PARALLEL_BATCH_SIZE,
+                       executor: ProcessPoolExecutor = None, parallel: bool = None,
+                       **options) -> List[Union[bytes, None]]:
+    """
+    Pickle many objects, spread across a process pool in chunks.
+    Objects are sent to the worker processes by pickling them, so a plain pickle gains nothing from the pool; by
+    default, the pool is only used when options add work beyond that (compression or out_of_band).
+    :param objs: The objects to pickle.
+    :type objs: Iterable[object]
+    :param max_workers: (Optional) Number of worker processes. Defaults to the number of CPUs.
+    :type max_workers: int
+    :param chunk_size: (Optional) Number of objects sent to a worker at a time. Defaults to a quarter of an even
+    share per worker.
+    :type chunk_size: int
+    :param min_parallel_batch_size: Pickle batches smaller than this in-process.
+    :type min_parallel_batch_size: int
+    :param executor: (Optional) Process pool to use (and keep warm across calls) instead of starting one per call.
+    :type executor: ProcessPoolExecutor
+    :param parallel: (Optional) Whether to use the process pool. Defaults to only when compression or out_of_band is
+    set (e.g. set True for objects with expensive __reduce__ methods).
+    :type parallel: bool
+    :param options: Keyword arguments for object_to_pickle (protocol, out_of_band, compression, etc.)
+    :return: Pickled objects, in the same order as objs (None for any that could not be pickled).
+    :rtype: List[Union[bytes, None]]
+    """
+    if parallel is None:
+        parallel = bool(options.get("compression") or options.get("out_of_band"))
+    return _map_in_chunks(functools.partial(_pickle_chunk, options=options), list(objs), parallel=parallel,
+                          max_workers=max_workers, chunk_size=chunk_size,
+                          min_parallel_batch_size=min_parallel_batch_size, executor=executor)
+
+
+def pickles_to_objects(pickled_objs: Iterable[bytes], max_workers: int = None, chunk_size: int = None,
+                       min_parallel_batch_size: int = DEFAULT_MIN_PARALLEL_BATCH_SIZE,
+                       executor: ProcessPoolExecutor = None, parallel: bool = None) -> List[Union[object, None]]:
+    """
+    Unpickle many objects, spread across a process pool in chunks.
+    Objects are sent back from the worker processes by pickling them, so a plain pickle gains nothing from the pool;
+    by default, the pool is only used when some of the pickles are compressed.
+    :param pickled_objs: The pickled objects (plain or framed, see pickle_to_object).
+    :type pickled_objs: Iterable[bytes]
+    :param max_workers: (Optional) Number of worker processes. Defaults to the number of CPUs.
+    :type max_workers: int
+    :param chunk_size: (Optional) Number of pickles sent to a worker at a time. Defaults to a quarter of an even
+    share per worker.
+    :type chunk_size: int
+    :param min_parallel_batch_size: Unpickle batches smaller than this in-process.
+    :type min_parallel_batch_size: int
+    :param executor: (Optional) Process pool to use (and keep warm across calls) instead of starting one per call.
+    :type executor: ProcessPoolExecutor
+    :param parallel: (Optional) Whether to use the process pool. Defaults to only when some pickles are compressed
+    (e.g. set True for objects with expensive __setstate__ methods).
+    :type parallel: bool
+    :return: Unpickled objects, in the same order as pickled_objs (None for any that could not be unpickled).
+    :rtype: List[Union[object, None]]
+    """
+    pickled_objs = list(pickled_objs)
+    if parallel is None:
+        parallel = any(_is_compressed_pickle(pickled_obj) for pickled_obj in pickled_objs)
+    return _map_in_chunks(_unpickle_chunk, pickled_objs, parallel=parallel, max_workers=max_workers,
+                          chunk_size=chunk_size, min_parallel_batch_size=min_parallel_batch_size, executor=executor)
+
+
 def load_object_from_sqlite(name: str, db_path: str) -> Union[object, None]:
     """
     Load an object from a sqlite database.
@@ -90,8 +553,618 @@ def load_object_from_sqlite(name: str, db_path: str) -> Union[object, None]:
     :return: The object.
     :rtype: Union[object, None]
     """
-    dictionary = load_dict_from_sqlite(file_path=db_path)
-    pickled_obj = dictionary.get(name)
-    if pickled_obj is None:
-        return None
-    return pickle_to_object(pickled_obj)
+    with ObjectStore(db_path=db_path, journal_mode=None) as store:
+        return store.get(name=name)
+
+
+class ObjectStore:
+    """
+    Persistent store of pickled objects in a SQLite database, keyed by name.
+    Keeps one connection open (in WAL mode by default, so readers are not blocked by a writer), reads and writes single
+    keys directly, and reads or writes batches in one transaction.
+    Uses the same format as save_object_to_sqlite and load_object_from_sqlite (and sqlitedict), so existing databases
+    can be opened as they are.
+    """
+
+    def __init__(self, db_path: str, table_name: str = DEFAULT_TABLE_NAME, compress: bool = False,
+                 compression_level: int = 6, compression_threshold: int = 1024, journal_mode: str = "WAL",
+                 serializer: Union[str, Serializer] = None):
+        """
+        :param db_path: The path to the sqlite database (created if it does not exist).
+        :type db_path: str
+        :param table_name: The name of the table to store objects in.
+        :type table_name: str
+        :param compress: Whether to compress pickled objects with zlib. Compressed objects can be read whatever this
+        is set to.
+        :type compress: bool
+        :param compression_level: The zlib compression level (1-9).
+        :type compression_level: int
+        :param compression_threshold: Only compress pickled objects of at least this many bytes.
+        :type compression_threshold: int
+        :param journal_mode: (Optional) SQLite journal mode to set, or None to leave the database's mode unchanged.
+        :type journal_mode: str
+        :param serializer: (Optional) Serializer to store objects with (see python8.core.serializers). Defaults to
+        object_to_pickle, the format used by save_object_to_sqlite.
+        :type serializer: Union[str, Serializer]
+        """
+        self.db_path = db_path
+        self.serializer = get_serializer(serializer) if serializer is not None else None
+        self.compress = compress
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        # The default format pickles the pickled bytes again, as save_object_to_sqlite always has (sqlitedict
+        # compatible); with a serializer, its output is stored as it is
+        codec = {"encode": sqlite3.Binary, "decode": bytes} if self.serializer else {}
+        # Values are written straight away, so there is no need to cache decoded pickles
+        self._db = LazySQLiteDict(file_path=db_path, table_name=table_name, cache_size=0, journal_mode=journal_mode,
+                                  **codec)
+
+    def _pack(self, obj: object) -> Union[bytes, None]:
+        data = self.serializer.dumps(obj) if self.serializer else object_to_pickle(obj)
+        if self.compress and data is not None and len(data) >= self.compression_threshold:
+            compressed = zlib.compress(data, self.compression_level)
+            if len(_ZLIB_PREFIX) + len(compressed) < len(data):
+                return _ZLIB_PREFIX + compressed
+        return data
+
+    def _unpack(self, data: Union[bytes, None]) -> Union[object, None]:
+        if data is None:
+            return None
+        if data.startswith(_ZLIB_PREFIX):
+            data = zlib.decompress(memoryview(data)[len(_ZLIB_PREFIX):])
+        return self.serializer.loads(data) if self.serializer else pickle_to_object(data)
+
+    def put(self, name: str, obj: object) -> None:
+        """
+        Save an object.
+        :param name: The name of the object.
+        :type name: str
+        :param obj: The object to save.
+        :type obj: object
+        :return: None
+        :rtype: None
+        """
+        self._db[name] = self._pack(obj)
+        self._db.commit()
+
+    def get(self, name: str, default: Any = None) -> Union[object, None]:
+        """
+        Load an object.
+        :param name: The name of the object.
+        :type name: str
+        :param default: The value to return if there is no object with this name.
+        :type default: Any
+        :return: The object.
+        :rtype: Union[object, None]
+        """
+        try:
+            data = self._db[name]
+        except KeyError:
+            return default
+        return self._unpack(data)
+
+    def put_many(self, objects: Dict[str, object]) -> None:
+        """
+        Save several objects in one transaction.
+        :param objects: Dictionary of name to object.
+        :type objects: Dict[str, object]
+        :return: None
+        :rtype: None
+        """
+        # Serialize everything before writing, so an object that cannot be serialized leaves the store untouched
+        packed = {name: self._pack(obj) for name, obj in objects.items()}
+        self._db.set_many(packed)
+
+    def get_many(self, names: Iterable[str]) -> Dict[str, object]:
+        """
+        Load several objects at once. Names that are not found are omitted.
+        :param names: The names of the objects.
+        :type names: Iterable[str]
+        :return: Dictionary of name to object, in the same order as names.
+        :rtype: Dict[str, object]
+        """
+        return {name: self._unpack(data) for name, data in self._db.get_many(names).items()}
+
+    def delete(self, name: str) -> bool:
+        """
+        Delete an object.
+        :param name: The name of the object.
+        :type name: str
+        :return: Whether the object existed.
+        :rtype: bool
+        """
+        try:
+            del self._db[name]
+        except KeyError:
+            return False
+        self._db.commit()
+        return True
+
+    def keys(self) -> Iterator[str]:
+        """
+        Iterate over the names of every stored object.
+        """
+        return iter(self._db)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._db
+
+    def __len__(self) -> int:
+        return len(self._db)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._db.close()
+
+    def __enter__(self) -> 'ObjectStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def stable_hash(obj: object) -> str:
+    """
+    Hash an object so that equal values of the same type get the same hash in every process and across restarts
+    (unlike hash(), which is randomized for strings). This holds for scalars and (nested) built-in containers, where
+    dictionaries and sets are hashed independently of their order.
+    Other objects are hashed by their pickle, so equal objects only get the same hash if they pickle to the same bytes:
+    e.g. an object holding a set of strings may not, as the set's order changes between processes.
+    :param obj: The object to hash.
+    :type obj: object
+    :return: Hex digest.
+    :rtype: str
+    :raises pickle.PicklingError: If the object (or an object inside a container) cannot be pickled (TypeError or
+    AttributeError are also possible, depending on the object)
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    _update_stable_hash(hasher, obj)
+    return hasher.hexdigest()
+
+
+def _update_stable_hash(hasher, obj: object) -> None:
+    obj_type = type(obj)
+    if obj is None or obj_type in (bool, int, float, complex):
+        hasher.update(f"{obj_type.__name__}:{obj!r};".encode())
+    elif obj_type is str:
+        encoded = obj.encode('utf-8', 'surrogatepass')
+        hasher.update(f"str:{len(encoded)}:".encode())
+        hasher.update(encoded)
+    elif obj_type in (bytes, bytearray):
+        hasher.update(f"{obj_type.__name__}:{len(obj)}:".encode())
+        hasher.update(obj)
+    elif obj_type in (tuple, list):
+        hasher.update(f"{obj_type.__name__}:{len(obj)}:".encode())
+        for item in obj:
+            _update_stable_hash(hasher, item)
+    elif obj_type in (dict, set, frozenset):
+        # Hash each item on its own, then combine them in sorted order
+        items = obj.items() if obj_type is dict else ((item, None) for item in obj)
+        hasher.update(f"{obj_type.__name__}:{len(obj)}:".encode())
+        for digest in sorted(stable_hash(item) for item in items):
+            hasher.update(digest.encode())
+    else:
+        hasher.update(f"pickle:{obj_type.__module__}.{obj_type.__qualname__}:".encode())
+        hasher.update(pickle.dumps(obj, protocol=4))
+
+
+class DiskCache:
+    """
+    Persistent cache of function results in a SQLite database, shared across processes and restarts.
+    Entries expire after a time-to-live, and the least recently used entries are evicted when the cache grows past
+    a maximum size. The database is in WAL mode, so several processes can read while one writes.
+    """
+
+    def __init__(self, db_path: str, ttl_seconds: float = None, max_size: int = None, compress: bool = False,
+                 table_name: str = "disk_cache", access_granularity: float = 60):
+        """
+        :param db_path: The path to the sqlite database (created if it does not exist).
+        :type db_path: str
+        :param ttl_seconds: (Optional) Number of seconds after which an entry expires. Defaults to never.
+        :type ttl_seconds: float
+        :param max_size: (Optional) Maximum total size of the stored results, in bytes. Defaults to unlimited.
+        :type max_size: int
+        :param compress: Whether to compress large results (see object_to_pickle).
+        :type compress: bool
+        :param table_name: The name of the table to store results in.
+        :type table_name: str
+        :param access_granularity: Only record an entry's access time on a hit if the recorded one is at least this
+        many seconds old, so hot entries do not cost a write on every hit. Eviction order is only this precise.
+        :type access_granularity: float
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.compress = compress
+        self.table_name = table_name
+        self.access_granularity = access_granularity
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # Opened on first use, and again in a forked child (SQLite connections must not be shared across processes)
+        self._connection = None
+        self._connection_pid = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get this process's connection, opening it (and creating the table) if needed. Must be called with the lock.
+        """
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+
+        connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        with connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self.table_name}" (key TEXT PRIMARY KEY, value BLOB NOT NULL, '
+                'size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)')
+            connection.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.table_name}_accessed" ON "{self.table_name}" (accessed)')
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached result, if it exists and has not expired.
+        :param key: The cache key.
+        :type key: str
+        :param default: The value to return on a miss.
+        :type default: Any
+        :return: The cached result, or default.
+        :rtype: Any
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(f'SELECT value, created, accessed FROM "{self.table_name}" WHERE key = ?',
+                                     (key,)).fetchone()
+            if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                with connection:
+                    connection.execute(f'DELETE FROM "{self.table_name}" WHERE key = ?', (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return default
+
+            if now - row[2] >= self.access_granularity:
+                with connection:
+                    connection.execute(f'UPDATE "{self.table_name}" SET accessed = ? WHERE key = ?', (now, key))
+            self.hits += 1
+        return pickle_to_object(row[0])
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Cache a result, evicting the least recently used entries if the cache is then too large.
+        :param key: The cache key.
+        :type key: str
+        :param value: The result to cache.
+        :type value: Any
+        :return: Whether the result was cached (results that cannot be pickled, or are larger than max_size, are not).
+        :rtype: bool
+        """
+        try:
+            data = object_to_pickle(value, compression='auto' if self.compress else None)
+        except (TypeError, AttributeError):
+            data = None
+        if data is None or (self.max_size is not None and len(data) > self.max_size):
+            return False
+
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    f'REPLACE INTO "{self.table_name}" (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)',
+                    (key, data, len(data), now, now))
+                if self.max_size is not None:
+                    self._evict(connection=connection, max_size=self.max_size)
+        return True
+
+    def _evict(self, connection: sqlite3.Connection, max_size: int) -> None:
+        """
+        Delete the least recently used entries until the total size is at most max_size.
+        """
+        total = connection.execute(f'SELECT COALESCE(SUM(size), 0) FROM "{self.table_name}"').fetchone()[0]
+        if total <= max_size:
+            return
+        evict = []
+        for key, size in connection.execute(f'SELECT key, size FROM "{self.table_name}" ORDER BY accessed'):
+            if total <= max_size:
+                break
+            evict.append((key,))
+            total -= size
+        connection.executemany(f'DELETE FROM "{self.table_name}" WHERE key = ?', evict)
+
+    def delete_expired(self) -> int:
+        """
+        Delete every expired entry.
+        :return: Number of entries deleted.
+        :rtype: int
+        """
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                return connection.execute(f'DELETE FROM "{self.table_name}" WHERE created < ?',
+                                          (time.time() - self.ttl_seconds,)).rowcount
+
+    def clear(self) -> None:
+        """
+        Delete every entry, and reset the statistics.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(f'DELETE FROM "{self.table_name}"')
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get the hits and misses of this process, and the number and total size of the stored entries.
+        :return: Dictionary of "hits", "misses", "hit_rate", "entries" and "size_bytes".
+        :rtype: dict
+        """
+        with self._lock:
+            entries, size = self._get_connection().execute(
+                f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM "{self.table_name}"').fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "size_bytes": size,
+            }
+
+    def close(self) -> None:
+        """
+        Close the database connection (it is reopened if the cache is used again).
+        """
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
+
+
+def disk_cache(db_path: str, ttl_seconds: float = None, max_size: int = None, compress: bool = False) -> Callable:
+    """
+    Decorator that caches a function's results on disk, keyed on a stable hash of its name and arguments, so they
+    survive process restarts (see DiskCache). The cache is available as the function's "cache" attribute.
+    Calls with arguments that cannot be hashed (see stable_hash) are not cached.
+    The database is only opened on the first call, so decorating functions at import time is cheap and safe to fork.
+
+    Example:
+        @disk_cache("cache.sqlite", ttl_seconds=3600)
+        def expensive(x):
+            ...
+
+        expensive.cache.stats()
+
+    :param db_path: The path to the sqlite database (created if it does not exist).
+    :type db_path: str
+    :param ttl_seconds: (Optional) Number of seconds after which a result expires. Defaults to never.
+    :type ttl_seconds: float
+    :param max_size: (Optional) Maximum total size of the stored results, in bytes. Defaults to unlimited.
+    :type max_size: int
+    :param compress: Whether to compress large results.
+    :type compress: bool
+    :return: Decorator
+    :rtype: Callable
+    """
+    cache = DiskCache(db_path=db_path, ttl_seconds=ttl_seconds, max_size=max_size, compress=compress)
+    missing = object()
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = stable_hash((name, args, kwargs))
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+                # Arguments that cannot be hashed (e.g. a lambda or a lock) cannot be looked up, so call uncached
+                return func(*args, **kwargs)
+            result = cache.get(key, default=missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def _default_shared_directory() -> str:
+    # /dev/shm is RAM-backed on Linux, so mapped files there never touch the disk
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+def _file_identity(stat: os.stat_result) -> tuple:
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class SharedMapping(Mapping):
+    """
+    Read-only mapping whose values are kept pickled in one buffer, and only unpickled when looked up.
+    Published through SharedObject, the buffer is used straight from the shared pages, so each process only holds the
+    keys (and their offsets in the buffer) plus the values it actually reads. Values are unpickled again on every
+    lookup, so each one is a fresh copy.
+    """
+
+    def __init__(self, mapping: Mapping = None, protocol: int = None):
+        """
+        :param mapping: (Optional) The keys and values to store.
+        :type mapping: Mapping
+        :param protocol: (Optional) Pickle protocol for the values. Defaults to pickle.HIGHEST_PROTOCOL.
+        :type protocol: int
+        """
+        protocol = pickle.HIGHEST_PROTOCOL if protocol is None else protocol
+        index = {}
+        parts = []
+        offset = 0
+        for key, value in (mapping or {}).items():
+            data = pickle.dumps(value, protocol=protocol)
+            index[key] = (offset, len(data))
+            parts.append(data)
+            offset += len(data)
+        self._set_buffer(index=index, buffer=b''.join(parts))
+
+    def _set_buffer(self, index: Dict[Any, Tuple[int, int]], buffer) -> None:
+        self._index = index
+        # The exporting object (bytes, or a view of a SharedObject's mapped file) is kept for as long as the mapping,
+        # and values are read through a view of it that never has buffers exported from it
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+    @classmethod
+    def _from_parts(cls, index: Dict[Any, Tuple[int, int]], buffer) -> 'SharedMapping':
+        mapping = cls.__new__(cls)
+        mapping._set_buffer(index=index, buffer=buffer)
+        return mapping
+
+    def __reduce_ex__(self, protocol):
+        # With protocol 5 the values buffer can be written out-of-band, and so mapped rather than copied by readers
+        buffer = pickle.PickleBuffer(self._buffer) if protocol >= 5 else self._view.tobytes()
+        return SharedMapping._from_parts, (self._index, buffer)
+
+    def __getitem__(self, key) -> Any:
+        offset, length = self._index[key]
+        return pickle.loads(self._view[offset:offset + length])
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class SharedObject:
+    """
+    Read-only object shared between processes through a memory-mapped file.
+    One process publishes the object; every other process maps the same file (one copy in RAM, however many
+    processes) and unpickles it. Large buffers (NumPy arrays, and anything else that supports PickleBuffer) are used
+    straight from the shared pages without being copied; other Python objects are still built in each process.
+    In particular, a plain dictionary is rebuilt in full in every process, so it saves no RAM: publish a
+    SharedMapping instead, whose values stay pickled in the shared pages and are only unpickled when looked up.
+    Republishing writes a new file and atomically swaps it in: attached processes pick up the new version on their
+    next get(), and their old version stays valid until they do.
+    """
+
+    def __init__(self, name: str, directory: str = None):
+        """
+        :param name: The name of the shared object (a file name, shared by every process using it).
+        :type name: str
+        :param directory: (Optional) The directory for the shared file. Defaults to /dev/shm if it exists (RAM-backed),
+        else the system temp directory.
+        :type directory: str
+        """
+        self.name = name
+        self.directory = directory or _default_shared_directory()
+        self.path = os.path.join(self.directory, f"{name}.p8shm")
+
+        self._lock = threading.Lock()
+        self._identity = None
+        self._version = None
+        self._object = None
+
+    def _read_version(self) -> Union[int, None]:
+        try:
+            with open(self.path, 'rb') as f:
+                magic, version = _SHARED_HEADER.unpack(f.read(_SHARED_HEADER.size))
+        except (FileNotFoundError, struct.error):
+            return None
+        return version if magic == _SHARED_MAGIC else None
+
+    def publish(self, obj: object, out_of_band_threshold: int = DEFAULT_OUT_OF_BAND_THRESHOLD) -> int:
+        """
+        Publish a new version of the object.
+        Publishers are not coordinated with each other, so only one process should publish a given name at a time.
+        :param obj: The object to share.
+        :type obj: object
+        :param out_of_band_threshold: Minimum size of bytes and bytearray objects to keep out of the pickle stream.
+        :type out_of_band_threshold: int
+        :return: The new version number.
+        :rtype: int
+        """
+        data, buffers = _dump_segments(obj, out_of_band=True, out_of_band_threshold=out_of_band_threshold)
+        version = (self._read_version() or 0) + 1
+
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{self.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(_SHARED_HEADER.pack(_SHARED_MAGIC, version))
+                _write_framed(f.write, data=data, buffers=buffers, codec=None)
+            # Readers either see the old file or the new one, never a partial write
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        return version
+
+    def get(self) -> Union[object, None]:
+        """
+        Get the latest published version of the object, attaching to it (or re-attaching after a republish) if needed.
+        The object must be treated as read-only: shared buffers are mapped read-only, and other changes are not seen
+        by other processes.
+        :return: The object, or None if it has not been published.
+        :rtype: Union[object, None]
+        """
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return self._object
+            if _file_identity(stat) != self._identity:
+                self._attach()
+            return self._object
+
+    def _attach(self) -> None:
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            # Unlinked since get() checked it; keep the current version
+            return
+        with f:
+            # Identify the file actually opened, which may be newer than the one get() checked
+            identity = _file_identity(os.fstat(f.fileno()))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, version = _SHARED_HEADER.unpack_from(view, 0)
+        framed_magic, codec_id = _FRAMED_HEADER.unpack_from(view, _SHARED_HEADER.size)
+        if magic != _SHARED_MAGIC or framed_magic != _FRAMED_MAGIC or codec_id:
+            raise ValueError(f"{self.path} is not a shared object file")
+        # The map stays open for as long as any unpickled object references it
+        self._object = _read_framed_body(view[_SHARED_HEADER.size + _FRAMED_HEADER.size:])
+        self._version = version
+        self._identity = identity
+
+    @property
+    def version(self) -> Union[int, None]:
+        """
+        The version of the object this process is attached to (None if not attached yet).
+        """
+        return self._version
+
+    def unlink(self) -> None:
+        """
+        Remove the shared file. Processes that are attached keep their current version.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,169 @@
+"""
+Serializers that turn objects into bytes and back behind one interface, so storage helpers (ObjectStore, the SQLite
+dictionary helpers, etc.) can use whichever suits the data.
+"""
+import marshal
+import pickle
+from typing import Any, Callable, Dict, List, Union
+
+import python8.core.json_backend as json_backend
+
+PICKLE = "pickle"
+JSON = "json"
+MARSHAL = "marshal"
+MSGPACK = "msgpack"
+
+
+class Serializer:
+    """
+    Base class for serializers.
+    """
+    name: str = None
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize an object.
+        :param obj: Object to serialize
+        :type obj: Any
+        :return: Serialized bytes
+        :rtype: bytes
+        """
+        raise NotImplementedError
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize an object.
+        :param data: Serialized bytes
+        :type data: bytes
+        :return: Deserialized object
+        :rtype: Any
+        """
+        raise NotImplementedError
+
+
+class PickleSerializer(Serializer):
+    """
+    Any picklable object. Python-only, and must not be used on untrusted data.
+    """
+    name = PICKLE
+
+    def __init__(self, protocol: int = None):
+        """
+        :param protocol: (Optional) Pickle protocol. Defaults to pickle.DEFAULT_PROTOCOL.
+        :type protocol: int
+        """
+        self.protocol = protocol
+
+    def dumps(self, obj: Any) -> bytes:
+        return pickle.dumps(obj, protocol=self.protocol)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class JSONSerializer(Serializer):
+    """
+    JSON types only (dict keys become strings), through the fastest installed JSON backend. Portable and safe.
+    """
+    name = JSON
+
+    def dumps(self, obj: Any) -> bytes:
+        return json_backend.dumps_bytes(obj, compact=True)
+
+    def loads(self, data: bytes) -> Any:
+        return json_backend.loads(bytes(data))
+
+
+class MarshalSerializer(Serializer):
+    """
+    Built-in types only. Very fast, but the format can change between Python versions, so only use it for data
+    written and read by the same Python version (e.g. caches).
+    """
+    name = MARSHAL
+
+    def dumps(self, obj: Any) -> bytes:
+        return marshal.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return marshal.loads(data)
+
+
+class MsgpackSerializer(Serializer):
+    """
+    JSON types plus bytes, in a compact binary format. Portable and safe. Requires the msgpack package.
+    Tuples are loaded as lists.
+    """
+    name = MSGPACK
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("The msgpack serializer requires the msgpack package (pip install msgpack)")
+        self._msgpack = msgpack
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# Factories for each registered serializer, instantiated on first use (so optional dependencies are only imported
+# when needed)
+_factories: Dict[str, Callable[[], Serializer]] = {
+    PICKLE: PickleSerializer,
+    JSON: JSONSerializer,
+    MARSHAL: MarshalSerializer,
+    MSGPACK: MsgpackSerializer,
+}
+_instances: Dict[str, Serializer] = {}
+
+
+def register_serializer(name: str, factory: Callable[[], Serializer]) -> None:
+    """
+    Register a serializer, or replace a registered one.
+    :param name: Name to look the serializer up by
+    :type name: str
+    :param factory: Callable (e.g. a Serializer subclass) that returns the serializer
+    :type factory: Callable[[], Serializer]
+    :return: None
+    :rtype: None
+    """
+    _factories[name] = factory
+    _instances.pop(name, None)
+
+
+def get_serializer(serializer: Union[str, Serializer]) -> Serializer:
+    """
+    Get a registered serializer by name.
+    :param serializer: Name of the serializer, or a Serializer (returned as is)
+    :type serializer: Union[str, Serializer]
+    :return: The serializer
+    :rtype: Serializer
+    :raises ValueError: If no serializer is registered with that name
+    :raises ImportError: If the serializer's optional dependency is not installed
+    """
+    if isinstance(serializer, Serializer):
+        return serializer
+    if serializer not in _instances:
+        if serializer not in _factories:
+            raise ValueError(f"Unknown serializer {serializer!r}. Available: {', '.join(_factories)}")
+        _instances[serializer] = _factories[serializer]()
+    return _instances[serializer]
+
+
+def available_serializers() -> List[str]:
+    """
+    Get the names of the registered serializers whose dependencies are installed.
+    :return: Serializer names
+    :rtype: List[str]
+    """
+    names = []
+    for name in _factories:
+        try:
+            get_serializer(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
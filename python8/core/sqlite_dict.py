@@ -0,0 +1,428 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Same defaults as sqlitedict, so databases written by either can be read by the other
+DEFAULT_TABLE_NAME = "unnamed"
+
+# Maximum number of parameters per "IN (...)" query (SQLite's default limit is 999)
+_QUERY_CHUNK_SIZE = 500
+
+
+def encode_pickle(obj: Any) -> sqlite3.Binary:
+    """
+    Encode a value for storage (pickle, as used by sqlitedict).
+    :param obj: Value to encode
+    :type obj: Any
+    :return: Encoded value
+    :rtype: sqlite3.Binary
+    """
+    return sqlite3.Binary(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def decode_pickle(data: bytes) -> Any:
+    """
+    Decode a stored value (pickle, as used by sqlitedict).
+    :param data: Stored value
+    :type data: bytes
+    :return: Decoded value
+    :rtype: Any
+    """
+    return pickle.loads(bytes(data))
+
+
+def _content_digest(data) -> bytes:
+    """
+    Hash an encoded value, to compare stored and new values without decoding them.
+    """
+    if data is None:
+        return b''
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class _Deleted:
+    pass
+
+
+_DELETED = _Deleted()
+
+
+class LazySQLiteDict(MutableMapping):
+    """
+    Dictionary-like view of a key-value table in a SQLite database.
+    Keys are read on demand (through a bounded LRU cache) over one persistent connection, rather than loading the
+    whole database. Writes are buffered and committed together in a single transaction.
+    Compatible with databases created by sqlitedict.
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 table_name: str = DEFAULT_TABLE_NAME,
+                 cache_size: int = 1024,
+                 max_pending_writes: int = 10000,
+                 read_only: bool = False,
+                 encode: Callable[[Any], Any] = encode_pickle,
+                 decode: Callable[[Any], Any] = decode_pickle,
+                 journal_mode: str = None):
+        """
+        :param file_path: Path to the SQLite database (created if it does not exist, unless read_only)
+        :type file_path: str
+        :param table_name: Name of the key-value table
+        :type table_name: str
+        :param cache_size: Maximum number of decoded values kept in the LRU read cache (0 to disable)
+        :type cache_size: int
+        :param max_pending_writes: Number of buffered writes after which they are committed automatically
+        :type max_pending_writes: int
+        :param read_only: Open the database read-only
+        :type read_only: bool
+        :param encode: Function to encode values before storing them
+        :type encode: Callable
+        :param decode: Function to decode stored values
+        :type decode: Callable
+        :param journal_mode: (Optional) SQLite journal mode to set, e.g. "WAL" so readers are not blocked by a writer
+        :type journal_mode: str
+        """
+        self.file_path = file_path
+        self.table_name = table_name
+        self.cache_size = cache_size
+        self.max_pending_writes = max_pending_writes
+        self.read_only = read_only
+        self.encode = encode
+        self.decode = decode
+        self._digest_table_name = f"{table_name}_python8_digests"
+
+        self._cache: OrderedDict = OrderedDict()
+        self._pending: dict = {}
+        self._lock = threading.RLock()
+
+        if read_only:
+            self._connection = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._connection = sqlite3.connect(file_path, check_same_thread=False)
+            if journal_mode:
+                self._connection.execute(f'PRAGMA journal_mode={journal_mode}')
+            with self._connection:
+                self._connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table_name}" (key TEXT PRIMARY KEY, value BLOB)')
+        self._digest_table_created = False
+
+    def _create_digest_table(self) -> None:
+        """
+        Create the sidecar table of key -> digest of the stored value, used by sync to skip unchanged values without
+        reading them. Triggers drop a key's digest whenever its value is written by anything else (including
+        sqlitedict), and keys without a digest are treated as changed, so a digest can never hide a change.
+        Only created by sync, so databases that are never synced are left as they are (and writes to them do not pay
+        for the triggers).
+        """
+        if self._digest_table_created:
+            return
+        digests = self._digest_table_name
+        self._connection.execute(f'CREATE TABLE IF NOT EXISTS "{digests}" (key TEXT PRIMARY KEY, digest BLOB)')
+        for event, keys in (("INSERT", ("NEW",)), ("UPDATE", ("OLD", "NEW")), ("DELETE", ("OLD",))):
+            conditions = " OR ".join(f"key = {row}.key" for row in keys)
+            self._connection.execute(
+                f'CREATE TRIGGER IF NOT EXISTS "{digests}_{event.lower()}" AFTER {event} ON "{self.table_name}" '
+                f'BEGIN DELETE FROM "{digests}" WHERE {conditions}; END')
+        self._digest_table_created = True
+
+    # region Cache
+
+    def _cache_get(self, key) -> Any:
+        value = self._cache.get(key, _DELETED)
+        if value is not _DELETED:
+            self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key, value) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # endregion
+
+    # region Mapping
+
+    def __getitem__(self, key) -> Any:
+        with self._lock:
+            if key in self._pending:
+                value = self._pending[key]
+                if value is _DELETED:
+                    raise KeyError(key)
+                return value
+
+            value = self._cache_get(key)
+            if value is not _DELETED:
+                return value
+
+            row = self._connection.execute(f'SELECT value FROM "{self.table_name}" WHERE key = ?',
+                                           (key,)).fetchone()
+            if row is None:
+                raise KeyError(key)
+            value = self.decode(row[0])
+            self._cache_put(key, value)
+            return value
+
+    def __setitem__(self, key, value) -> None:
+        self._check_writable()
+        with self._lock:
+            self._pending[key] = value
+            self._cache_put(key, value)
+            if len(self._pending) >= self.max_pending_writes:
+                self.commit()
+
+    def __delitem__(self, key) -> None:
+        self._check_writable()
+        with self._lock:
+            if key not in self:
+                raise KeyError(key)
+            self._pending[key] = _DELETED
+            self._cache.pop(key, None)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key] is not _DELETED
+            if key in self._cache:
+                return True
+            row = self._connection.execute(f'SELECT 1 FROM "{self.table_name}" WHERE key = ?', (key,)).fetchone()
+            return row is not None
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            self.commit()
+            keys = self._connection.execute(f'SELECT key FROM "{self.table_name}" ORDER BY rowid')
+        for row in keys:
+            yield row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.commit()
+            return self._connection.execute(f'SELECT COUNT(*) FROM "{self.table_name}"').fetchone()[0]
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Iterate over every key-value pair, streaming rows from the database.
+        """
+        with self._lock:
+            self.commit()
+            rows = self._connection.execute(f'SELECT key, value FROM "{self.table_name}" ORDER BY rowid')
+        for key, value in rows:
+            yield key, self.decode(value)
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterate over every value, streaming rows from the database.
+        """
+        for _, value in self.items():
+            yield value
+
+    def get_many(self, keys) -> dict:
+        """
+        Get the values of several keys at once. Missing keys are omitted.
+        Keys that are not buffered or cached are read together, in one query per chunk of keys.
+        :param keys: Keys to look up
+        :return: Dictionary of the keys found and their values
+        :rtype: dict
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._pending:
+                    if self._pending[key] is not _DELETED:
+                        found[key] = self._pending[key]
+                    continue
+                value = self._cache_get(key)
+                if value is _DELETED:
+                    missing.append(key)
+                else:
+                    found[key] = value
+
+            for start in range(0, len(missing), _QUERY_CHUNK_SIZE):
+                chunk = missing[start:start + _QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self._connection.execute(
+                    f'SELECT key, value FROM "{self.table_name}" WHERE key IN ({placeholders})', chunk)
+                for key, stored in rows:
+                    value = self.decode(stored)
+                    self._cache_put(key, value)
+                    found[key] = value
+        # In the same order as the keys given
+        return {key: found[key] for key in keys if key in found}
+
+    def set_many(self, items: dict) -> None:
+        """
+        Set several keys and commit them, along with any other buffered changes, in a single transaction.
+        Unlike setting keys one by one, max_pending_writes does not split the write into several commits.
+        If the write fails, every buffered change is discarded.
+        :param items: Dictionary of keys and values to set
+        :type items: dict
+        """
+        self._check_writable()
+        with self._lock:
+            for key, value in items.items():
+                self._pending[key] = value
+                self._cache_put(key, value)
+            try:
+                self.commit()
+            except BaseException:
+                self.rollback()
+                raise
+
+    # endregion
+
+    # region Transactions
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise RuntimeError(f"{self.file_path} was opened read-only")
+
+    def commit(self) -> None:
+        """
+        Write every buffered change to the database in a single transaction.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            upserts = [(key, self.encode(value)) for key, value in self._pending.items() if value is not _DELETED]
+            deletes = [(key,) for key, value in self._pending.items() if value is _DELETED]
+            with self._connection:
+                if upserts:
+                    self._connection.executemany(
+                        f'REPLACE INTO "{self.table_name}" (key, value) VALUES (?, ?)', upserts)
+                if deletes:
+                    self._connection.executemany(f'DELETE FROM "{self.table_name}" WHERE key = ?', deletes)
+            self._pending.clear()
+
+    def _stored_keys(self, keys: List) -> List:
+        """
+        Get the form each key takes in the key column, where TEXT affinity stores numbers as text (formatted by SQLite,
+        which does not always match str()). Other keys are stored as they are.
+        """
+        stored = list(keys)
+        numeric = [index for index, key in enumerate(keys) if isinstance(key, (int, float))]
+        for start in range(0, len(numeric), _QUERY_CHUNK_SIZE):
+            chunk = numeric[start:start + _QUERY_CHUNK_SIZE]
+            columns = ", ".join("CAST(? AS TEXT)" for _ in chunk)
+            row = self._connection.execute(f'SELECT {columns}', [keys[index] for index in chunk]).fetchone()
+            for index, stored_key in zip(chunk, row):
+                stored[index] = stored_key
+        return stored
+
+    def _stored_digests(self, keys: List) -> Dict[Any, bytes]:
+        """
+        Get the recorded digest of each stored key (None if it has no digest yet), given keys in their stored form
+        (see _stored_keys). Keys that are not stored are omitted. Only the keys and digests are read, never the values.
+        """
+        digests = {}
+        for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+            chunk = keys[start:start + _QUERY_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._connection.execute(
+                f'SELECT stored.key, digests.digest FROM "{self.table_name}" AS stored '
+                f'LEFT JOIN "{self._digest_table_name}" AS digests ON digests.key = stored.key '
+                f'WHERE stored.key IN ({placeholders})', chunk)
+            digests.update(rows)
+        return digests
+
+    def sync(self, dictionary: dict, delete_missing: bool = True) -> Dict[str, List]:
+        """
+        Make the database match a dictionary, writing only the keys that were inserted, changed or deleted.
+        Stored and new values are compared by the hash of their encoded content, recorded by previous syncs, so
+        unchanged values are neither read nor rewritten (values without a recorded hash, e.g. written by sqlitedict,
+        are rewritten once). Every change is written in a single transaction.
+        :param dictionary: Dictionary to save
+        :type dictionary: dict
+        :param delete_missing: Delete stored keys that are not in the dictionary
+        :type delete_missing: bool
+        :return: Summary of the keys that were "inserted", "updated", "deleted" and the number "unchanged"
+        :rtype: Dict[str, List]
+        """
+        self._check_writable()
+        with self._lock:
+            self.commit()
+            with self._connection:
+                self._create_digest_table()
+
+            # Compare keys as stored, so e.g. the key 1 matches the stored key '1'
+            keys = list(dictionary.keys())
+            stored_keys = self._stored_keys(keys=keys)
+            stored_digests = self._stored_digests(keys=stored_keys)
+
+            inserts, updates, new_digests = [], [], []
+            for key, stored_key in zip(keys, stored_keys):
+                encoded = self.encode(dictionary[key])
+                digest = _content_digest(encoded)
+                if stored_key not in stored_digests:
+                    inserts.append((key, encoded))
+                elif stored_digests[stored_key] != digest:
+                    updates.append((key, encoded))
+                else:
+                    continue
+                new_digests.append((key, digest))
+
+            deletes = []
+            if delete_missing:
+                kept = set(stored_keys)
+                rows = self._connection.execute(f'SELECT key FROM "{self.table_name}"')
+                deletes = [(key,) for (key,) in rows if key not in kept]
+
+            with self._connection:
+                if deletes:
+                    self._connection.executemany(f'DELETE FROM "{self.table_name}" WHERE key = ?', deletes)
+                if inserts or updates:
+                    self._connection.executemany(
+                        f'REPLACE INTO "{self.table_name}" (key, value) VALUES (?, ?)', inserts + updates)
+                    # After the values, as writing a value drops its digest
+                    self._connection.executemany(
+                        f'REPLACE INTO "{self._digest_table_name}" (key, digest) VALUES (?, ?)', new_digests)
+
+            for (key,) in deletes:
+                self._cache.pop(key, None)
+            for key, _ in inserts + updates:
+                self._cache.pop(key, None)
+
+            return {
+                "inserted": [key for key, _ in inserts],
+                "updated": [key for key, _ in updates],
+                "deleted": [key for (key,) in deletes],
+                "unchanged": len(dictionary) - len(inserts) - len(updates),
+            }
+
+    def rollback(self) -> None:
+        """
+        Discard every buffered change.
+        """
+        with self._lock:
+            for key in self._pending:
+                self._cache.pop(key, None)
+            self._pending.clear()
+
+    def close(self) -> None:
+        """
+        Commit buffered changes and close the connection.
+        """
+        with self._lock:
+            if not self.read_only:
+                self.commit()
+            self._connection.close()
+
+    def __enter__(self) -> 'LazySQLiteDict':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self.rollback()
+        self.close()
+
+    # endregion
@@ -1,4 +1,59 @@
+import threading
+import time
 import uuid
+from typing import List
+
+from python8.core.crypto import SecureRandomPool, _default_pool
+
+# Masks to set the version (4) and variant (RFC 4122) bits of a random 128-bit integer
+_UUID4_CLEAR_MASK = ~(0xc000 << 48) & ~(0xf000 << 64)
+_UUID4_SET_BITS = (0x8000 << 48) | (4 << 76)
+
+# UUIDv7 layout: 48-bit millisecond timestamp, version, 12 + 30 counter bits split around the variant, 32 random bits
+_UUID7_COUNTER_BITS = 42
+_UUID7_MAX_COUNTER = (1 << _UUID7_COUNTER_BITS) - 1
+
+
+class _TimeOrderedUUIDGenerator:
+    """
+    Thread-safe, monotonic UUID version 7 generator (RFC 9562, "fixed-length dedicated counter" method).
+    """
+
+    def __init__(self, pool: SecureRandomPool = None):
+        self._pool = pool or _default_pool
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def _reseed_counter(self) -> None:
+        # Start each millisecond at a random counter, leaving the top bit clear for increments
+        self._counter = int.from_bytes(self._pool.get_bytes(6), 'big') >> (48 - _UUID7_COUNTER_BITS + 1)
+
+    def generate(self) -> uuid.UUID:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._reseed_counter()
+            else:
+                # Same millisecond, or the clock went backwards: keep counting from the last value
+                self._counter += 1
+                if self._counter > _UUID7_MAX_COUNTER:
+                    self._last_ms += 1
+                    self._reseed_counter()
+            timestamp_ms, counter = self._last_ms, self._counter
+
+        random_bits = int.from_bytes(self._pool.get_bytes(4), 'big')
+        value = ((timestamp_ms & 0xffffffffffff) << 80
+                 | 7 << 76
+                 | (counter >> 30) << 64
+                 | 0b10 << 62
+                 | (counter & 0x3fffffff) << 32
+                 | random_bits)
+        return uuid.UUID(int=value)
+
+
+_time_ordered_uuid_generator = _TimeOrderedUUIDGenerator()
 
 
 def time_uuid() -> uuid.UUID:
@@ -19,6 +74,28 @@ def random_uuid() -> uuid.UUID:
     return uuid.uuid4()
 
 
+def time_ordered_uuid() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (UUID version 7).
+    UUIDs generated by this process are strictly increasing, even across threads and within the same millisecond,
+    which keeps database index inserts sequential.
+    :return: UUID
+    :rtype: uuid.UUID
+    """
+    return _time_ordered_uuid_generator.generate()
+
+
+def time_ordered_uuids(count: int) -> List[uuid.UUID]:
+    """
+    Generate many time-ordered UUIDs (UUID version 7), in increasing order.
+    :param count: Number of UUIDs to generate.
+    :type count: int
+    :return: List of UUIDs
+    :rtype: List[uuid.UUID]
+    """
+    return [_time_ordered_uuid_generator.generate() for _ in range(count)]
+
+
 def generate_uuid(use_random: bool = False) -> uuid.UUID:
     """
     Generate a UUID.
@@ -30,3 +107,20 @@ def generate_uuid(use_random: bool = False) -> uuid.UUID:
     if use_random:
         return random_uuid()
     return time_uuid()
+
+
+def random_uuids(count: int, pool: SecureRandomPool = None) -> List[uuid.UUID]:
+    """
+    Generate many random UUIDs (UUID version 4) from a shared pool of cryptographically-secure random bytes.
+    :param count: Number of UUIDs to generate.
+    :type count: int
+    :param pool: (Optional) Random byte pool to draw from. Defaults to a shared module-level pool.
+    :type pool: SecureRandomPool
+    :return: List of UUIDs
+    :rtype: List[uuid.UUID]
+    """
+    pool = pool or _default_pool
+    data = pool.get_bytes(16 * count)
+    from_bytes = int.from_bytes
+    return [uuid.UUID(int=(from_bytes(data[i:i + 16], 'big') & _UUID4_CLEAR_MASK) | _UUID4_SET_BITS)
+            for i in range(0, 16 * count, 16)]
@@ -1,16 +1,19 @@
 import yaml
 
+from python8.core.files import FileMode, open_file
+
 
 def load_from_file(file_path: str) -> dict:
     """
     Load a YAML file into a Python dictionary.
+    Files ending in .gz, .bz2, .xz or .zst are decompressed with the matching codec.
 
     :param file_path: Path to the YAML file
     :type file_path: str
     :return: Dictionary representation of the YAML file
     :rtype: dict
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
+    with open_file(file_path, mode=FileMode.READ, encoding='utf-8') as file:
         return yaml.load(file, Loader=yaml.FullLoader)
 
 
@@ -0,0 +1,30 @@
+import uuid
+from typing import Union
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    Store a UUID as a compact 16-byte BLOB, rather than a 36-character string.
+    Accepts uuid.UUID objects (or UUID strings) and returns uuid.UUID objects.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Union[uuid.UUID, str, None], dialect) -> Union[bytes, None]:
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value: Union[bytes, None], dialect) -> Union[uuid.UUID, None]:
+        if value is None:
+            return None
+        return uuid.UUID(bytes=bytes(value))
+
+    @property
+    def python_type(self):
+        return uuid.UUID
@@ -2,6 +2,7 @@ from python8.rest_api.controllers.authentication import (
     AuthenticationType,
     setup_authentication,
     require_authentication,
+    rotate_admin_api_key,
 )
 from python8.rest_api.controllers.base_controller import (
     BaseController as BaseController,
@@ -39,6 +39,24 @@ def _generate_and_save_admin_api_key(database: BaseDatabase) -> str | None:
     return api_key
 
 
+def rotate_admin_api_key(database: BaseDatabase) -> str | None:
+    """
+    Replace the admin API key with a newly-generated one.
+    This process stops accepting the previous key immediately, as its cached key is invalidated. Other processes
+    sharing the database keep accepting it until their cached key expires (see BaseDatabase's secret_cache_ttl).
+
+    :return: The new admin API key, or None if it could not be saved.
+    """
+    api_key: str = generate_random_alphanumeric_string()
+
+    hashed_api_key: str = generate_hash(secret=api_key)
+    if not SecretRepository(database=database).update_admin_api_key_in_database(api_key=hashed_api_key):
+        print("Could not save API key to database")
+        return None
+
+    return api_key
+
+
 def setup_authentication(database: BaseDatabase) -> tuple[None | str, bool]:
     """
     Setup authentication.
@@ -1,3 +1,6 @@
 from python8.rest_api.database.generic_secrets_model import (
     Secret as Secret,
 )
+from python8.rest_api.database.secret_cache import (
+    SecretCache as SecretCache,
+)
@@ -1,12 +1,18 @@
 from python8.database.base import SQLAlchemyDatabase
 from python8.rest_api.database.generic_secrets_model import Secret
+from python8.rest_api.database.secret_cache import SecretCache
 
 
 class BaseDatabase(SQLAlchemyDatabase):
     def __init__(self,
-                 sqlite_file: str):
+                 sqlite_file: str,
+                 secret_cache_ttl: float = 5):
         super().__init__(sqlite_file=sqlite_file)
         Secret.__table__.create(bind=self.engine, checkfirst=True)
+        # Secrets are read on every authenticated request, so keep them in memory between reads.
+        # Changes made through this object drop the cached value at once; changes made by other processes are only
+        # seen once it expires, hence the short TTL
+        self.secret_cache = SecretCache(ttl_seconds=secret_cache_ttl)
 
     # region Secrets
 
@@ -23,17 +29,43 @@ class BaseDatabase(SQLAlchemyDatabase):
                                                      value=value)
         except Exception as e:
             raise Exception("Failed to add secret to database")
+        finally:
+            self.secret_cache.invalidate(name=name)
+
+    def update_secret(self, name: str, value: str) -> bool:
+        """
+        Update an existing secret in the database
+        :param name:
+        :param value:
+        :return:
+        """
+        try:
+            entry = self._get_first_entry(table_schema=Secret, name=name)
+            if not entry:
+                raise Exception(f"Secret {name} does not exist")
+            return self._update_entry_single_field(entry=entry, field_name="value", field_value=value)
+        except Exception as e:
+            raise Exception("Failed to update secret in database")
+        finally:
+            self.secret_cache.invalidate(name=name)
 
     def get_secret_by_name(self, name: str) -> None | str:
         """
-        Get a secret by name
+        Get a secret by name, from the in-memory cache if available
         :param name:
         :return:
         """
+        cached_value = self.secret_cache.get(name=name)
+        if cached_value is not None:
+            return cached_value
+
         try:
-            return self._get_attribute_from_first_entry(table_schema=Secret, field_name="value",
-                                                        name=name)
+            value = self._get_attribute_from_first_entry(table_schema=Secret, field_name="value",
+                                                         name=name)
         except Exception as e:
             raise Exception("Failed to get secret from database")
 
+        self.secret_cache.set(name=name, value=value)
+        return value
+
     # endregion
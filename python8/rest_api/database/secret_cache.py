@@ -0,0 +1,78 @@
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class SecretCache:
+    """
+    Thread-safe in-memory cache of stored secret values (e.g. hashed API keys), with a time-to-live.
+    """
+
+    def __init__(self, ttl_seconds: float = 5):
+        """
+        :param ttl_seconds: How long a cached secret is trusted before it is re-read from the database.
+        A TTL of 0 or less disables caching.
+        :type ttl_seconds: float
+        """
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, name: str) -> None | str:
+        """
+        Get a cached secret value.
+        :param name: Name of the secret
+        :return: The cached value, or None if not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                value, expires_at = entry
+                if time.monotonic() < expires_at:
+                    self.hits += 1
+                    return value
+                del self._entries[name]
+            self.misses += 1
+            return None
+
+    def set(self, name: str, value: str) -> None:
+        """
+        Cache a secret value.
+        :param name: Name of the secret
+        :param value: Value of the secret
+        """
+        if not self.enabled or value is None:
+            return
+        with self._lock:
+            self._entries[name] = (value, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, name: str = None) -> None:
+        """
+        Drop a cached secret, or every cached secret if no name is provided.
+        :param name: (Optional) Name of the secret to drop
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def stats(self) -> dict:
+        """
+        Get cache hit/miss statistics.
+        :return: Dictionary of hits, misses, hit rate and number of cached entries.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+                "size": len(self._entries),
+            }
@@ -23,6 +23,19 @@ class SecretRepository(BaseRepository):
             print(f'Error adding master secret to database: {e}')
             return False
 
+    def update_admin_api_key_in_database(self, api_key: str) -> bool:
+        """
+        Replace the admin API key in the database
+
+        :param api_key: API key
+        :return:
+        """
+        try:
+            return self._database.update_secret(name=MASTER_KEY_NAME, value=api_key)
+        except Exception as e:
+            print(f'Error updating master secret in database: {e}')
+            return False
+
     def get_admin_api_key_from_database(self) -> None | str:
         """
         Get the admin API key from the database
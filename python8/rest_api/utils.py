@@ -1,3 +1,6 @@
+import python8.core.json_backend as json_backend
+
+
 def build_api_response(status_code: int = 200, data: dict = None) -> tuple['flask.Response', int]:
     """
     Build an API response with a status code and optional data.
@@ -5,11 +8,17 @@ def build_api_response(status_code: int = 200, data: dict = None) -> tuple['flas
     :param data: Data to include in the response (None by default).
     :return: Tuple containing the status code and data.
     """
-    from flask import jsonify
+    from flask import current_app
     if data is None:
         data = {}
 
-    response = jsonify(data)
+    # Serialize through the fastest available JSON backend, honoring the app's JSON provider settings like jsonify
+    json_provider = getattr(current_app, "json", None)
+    body = json_backend.dumps_bytes(data,
+                                    compact=True,
+                                    sort_keys=getattr(json_provider, "sort_keys", False),
+                                    default=getattr(json_provider, "default", None))
+    response = current_app.response_class(body, mimetype="application/json")
 
     headers = {
         "Content-Type": "application/json",
@@ -1,10 +1,10 @@
 import base64
-import json
 import os
 import zlib
 from enum import Enum
 from typing import Union, Any, List
 
+import python8.core.json_backend as json_backend
 import python8.core.logs as logs
 
 
@@ -23,7 +23,7 @@ class PrivatebinExpiration(Enum):
 
 
 def _json_encode(d):
-    return json.dumps(d, separators=(',', ':')).encode('utf-8')
+    return json_backend.dumps_bytes(d, compact=True)
 
 
 def _base58_encode(v):
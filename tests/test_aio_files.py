@@ -0,0 +1,13 @@
+import asyncio
+
+from python8.core.aio_files import gather_write
+
+
+def test_gather_write_text_and_bytes(tmp_path):
+    text_path = tmp_path / "a.txt"
+    bytes_path = tmp_path / "b.bin"
+
+    asyncio.run(gather_write({str(text_path): "text", str(bytes_path): b"\x00\x01"}))
+
+    assert text_path.read_text() == "text"
+    assert bytes_path.read_bytes() == b"\x00\x01"
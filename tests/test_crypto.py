@@ -0,0 +1,56 @@
+import pytest
+
+from python8.core.crypto import (
+    ALPHANUMERIC_ALPHABET,
+    URL_SAFE_ALPHABET,
+    SecureRandomPool,
+    generate_random_token,
+    generate_random_tokens,
+)
+
+
+@pytest.mark.parametrize("alphabet", [URL_SAFE_ALPHABET, ALPHANUMERIC_ALPHABET, "ab"])
+@pytest.mark.parametrize("length", [1, 7, 32])
+def test_tokens_have_requested_length_and_alphabet(alphabet, length):
+    tokens = generate_random_tokens(count=50, length=length, alphabet=alphabet)
+    assert len(tokens) == 50
+    assert all(len(token) == length and set(token) <= set(alphabet) for token in tokens)
+
+
+def test_zero_tokens():
+    assert generate_random_tokens(count=0) == []
+
+
+@pytest.mark.parametrize("length", [0, -1])
+def test_invalid_length_is_rejected(length):
+    with pytest.raises(ValueError):
+        generate_random_tokens(count=1, length=length)
+    with pytest.raises(ValueError):
+        generate_random_token(length=length)
+
+
+def test_negative_count_is_rejected():
+    with pytest.raises(ValueError):
+        generate_random_tokens(count=-1)
+
+
+@pytest.mark.parametrize("alphabet", ["", "a", "aab", "é" + URL_SAFE_ALPHABET])
+def test_invalid_alphabet_is_rejected(alphabet):
+    with pytest.raises(ValueError):
+        generate_random_tokens(count=1, alphabet=alphabet)
+
+
+def test_small_pool_refills_without_reusing_bytes():
+    pool = SecureRandomPool(pool_size=8)
+    chunks = [pool.get_bytes(5) for _ in range(100)]
+    assert all(len(chunk) == 5 for chunk in chunks)
+    assert len(set(chunks)) == len(chunks)
+
+    tokens = generate_random_tokens(count=20, length=40, pool=pool)
+    assert len(tokens) == 20 and all(len(token) == 40 for token in tokens)
+
+
+def test_pool_returns_large_requests_in_full():
+    pool = SecureRandomPool(pool_size=16)
+    assert len(pool.get_bytes(1000)) == 1000
+    assert pool.get_bytes(0) == b''
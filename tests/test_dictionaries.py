@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from python8.core.dictionaries import iterate_json_array_file
+
+VALID_ARRAYS = [
+    '[]',
+    ' [ ] ',
+    '[10.25]',
+    '[1.5e3, 2]',
+    '[-5e-08]',
+    '[1E+2,-0.5,0]',
+    '[1, "a b", {"x": [1, 2]}, 123456, null, true, false]',
+    '[ 12345678901234567890 , -1.0e-10 ]\n',
+    '[[1, [2.5]], {"k": -3e2}, "]", ","]',
+]
+
+INVALID_ARRAYS = [
+    '[1 2 3]',
+    '[1,]',
+    '[,1]',
+    '[1,,2]',
+    '[1, 2',
+    '[1,',
+    '[1]garbage',
+    '[] []',
+    '[10.2.5]',
+    '{}',
+]
+
+# Small buffer sizes put the boundary at every position of the (short) test documents
+BUFFER_SIZES = range(1, 12)
+
+
+def _write(tmp_path, content: str) -> str:
+    file_path = tmp_path / "array.json"
+    file_path.write_text(content)
+    return str(file_path)
+
+
+@pytest.mark.parametrize("content", VALID_ARRAYS)
+@pytest.mark.parametrize("buffer_size", BUFFER_SIZES)
+def test_iterate_json_array_file_matches_json_loads(tmp_path, content, buffer_size):
+    file_path = _write(tmp_path, content)
+    assert list(iterate_json_array_file(file_path, buffer_size=buffer_size)) == json.loads(content)
+
+
+@pytest.mark.parametrize("content", INVALID_ARRAYS)
+@pytest.mark.parametrize("buffer_size", BUFFER_SIZES)
+def test_iterate_json_array_file_rejects_malformed_input(tmp_path, content, buffer_size):
+    file_path = _write(tmp_path, content)
+    with pytest.raises(ValueError):
+        list(iterate_json_array_file(file_path, buffer_size=buffer_size))
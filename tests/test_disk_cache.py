@@ -0,0 +1,34 @@
+import threading
+
+from python8.core.objects import disk_cache, stable_hash
+
+
+def test_disk_cache_caches_results(tmp_path):
+    calls = []
+
+    @disk_cache(str(tmp_path / "cache.sqlite"))
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert calls == [2]
+    assert double.cache.stats()["hits"] == 1
+    double.cache.close()
+
+
+def test_disk_cache_calls_through_for_unhashable_arguments(tmp_path):
+    @disk_cache(str(tmp_path / "cache.sqlite"))
+    def call(func, lock=None):
+        return func()
+
+    assert call(lambda: 1, lock=threading.Lock()) == 1
+    assert call(lambda: 2) == 2
+    assert call.cache.stats()["entries"] == 0
+    call.cache.close()
+
+
+def test_stable_hash_ignores_container_order():
+    assert stable_hash({"a": 1, "b": {2, 3}}) == stable_hash({"b": {3, 2}, "a": 1})
+    assert stable_hash([1, 2]) != stable_hash((1, 2))
@@ -0,0 +1,54 @@
+import os
+import shutil
+
+import pytest
+
+from python8.core.files import copy_file, disk_usage, scan_directory
+
+
+def test_copy_file(tmp_path):
+    source = tmp_path / "a.txt"
+    source.write_bytes(b"data" * 1000)
+    assert copy_file(str(source), str(tmp_path / "sub" / "b.txt")) == 4000
+    assert (tmp_path / "sub" / "b.txt").read_bytes() == b"data" * 1000
+
+
+@pytest.mark.parametrize("link", [False, True])
+def test_copy_file_onto_itself_keeps_data(tmp_path, link):
+    source = tmp_path / "a.txt"
+    source.write_bytes(b"data")
+    destination = source
+    if link:
+        destination = tmp_path / "b.txt"
+        os.link(source, destination)
+
+    with pytest.raises(shutil.SameFileError):
+        copy_file(str(source), str(destination))
+    assert source.read_bytes() == b"data"
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "c").mkdir()
+    (root / "a" / "b" / "f.txt").write_bytes(b"12")
+    (root / "a" / "g.log").write_bytes(b"1")
+    (root / "c" / "h.txt").write_bytes(b"123")
+
+
+def test_scan_directory_include_and_exclude(tmp_path):
+    _make_tree(tmp_path)
+    root = str(tmp_path)
+
+    usage = {u.path: u.file_count for u in scan_directory(root, include=["*.txt"], exclude=["c"])}
+    assert usage == {root: 0, str(tmp_path / "a"): 0, str(tmp_path / "a" / "b"): 1}
+
+    totals = disk_usage(root, include=["a/*/*.txt", "*.log"])
+    assert (totals[root].file_count, totals[root].size_bytes) == (2, 3)
+
+
+def test_scan_directory_skips_symlink_cycles(tmp_path):
+    _make_tree(tmp_path)
+    os.symlink(tmp_path, tmp_path / "a" / "b" / "loop")
+
+    totals = disk_usage(str(tmp_path), follow_symlinks=True)
+    assert totals[str(tmp_path)].file_count == 3
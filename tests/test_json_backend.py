@@ -0,0 +1,34 @@
+import datetime
+import json
+
+import pytest
+
+from python8.core import json_backend
+
+OBJECTS = [
+    {"a": float("nan")},
+    [1, float("inf"), -float("inf")],
+    {"x": None, "s": "null", "y": [1.5, {"z": float("nan")}]},
+    {1: "a", 2.5: "b"},
+    {"k": "v", "n": [1, 2, 3]},
+]
+
+
+@pytest.fixture(params=json_backend.available_backends())
+def backend(request):
+    previous = json_backend.get_backend()
+    json_backend.set_backend(request.param)
+    yield request.param
+    json_backend.set_backend(previous)
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_compact_dumps_matches_standard_library(backend, obj):
+    expected = json.dumps(obj, separators=(',', ':'))
+    assert json_backend.dumps(obj, compact=True) == expected
+    assert json_backend.dumps_bytes(obj, compact=True) == expected.encode('utf-8')
+
+
+def test_keys_rejected_by_standard_library_are_rejected(backend):
+    with pytest.raises(TypeError):
+        json_backend.dumps({datetime.date(2020, 1, 1): 1}, compact=True)
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+OPTIONAL_DEPENDENCIES = ["sqlalchemy", "flask", "pydantic", "psutil"]
+
+
+def _run_in_subprocess(code: str) -> subprocess.CompletedProcess:
+    # A fresh interpreter, so modules imported by other tests (or pytest plugins) do not leak into sys.modules
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True,
+                          cwd=REPO_ROOT)
+
+
+def test_import_does_not_load_optional_dependencies():
+    result = _run_in_subprocess(f"""
+        import sys
+        import python8
+
+        loaded = [name for name in {OPTIONAL_DEPENDENCIES!r} if name in sys.modules]
+        assert not loaded, f"Importing python8 loaded {{loaded}}"
+    """)
+    assert result.returncode == 0, result.stderr
+
+
+def test_subpackage_resolves_on_access():
+    result = _run_in_subprocess("""
+        import types
+        import python8
+
+        assert python8.config is None or isinstance(python8.config, types.ModuleType)
+        assert isinstance(python8.objects, types.ModuleType)
+    """)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run_in_subprocess(code: str) -> subprocess.CompletedProcess:
+    # A crash while freeing shared buffers only shows at garbage collection or exit, so check the exit code
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True,
+                          cwd=REPO_ROOT)
+
+
+def test_publish_get_and_drop_shared_mapping(tmp_path):
+    result = _run_in_subprocess(f"""
+        import gc
+        from python8.core.objects import SharedMapping, SharedObject
+
+        shared = SharedObject("mapping", directory={str(tmp_path)!r})
+        shared.publish(SharedMapping({{"a": [1, 2], "b": b"x" * 100000}}))
+        mapping = shared.get()
+        assert mapping["a"] == [1, 2]
+        assert len(mapping["b"]) == 100000
+
+        shared.publish(SharedMapping({{"a": 3}}))
+        assert shared.get()["a"] == 3
+
+        del mapping
+        gc.collect()
+        shared.unlink()
+    """)
+    assert result.returncode == 0, result.stderr
+    assert "BufferError" not in result.stderr
+
+
+def test_out_of_band_round_trip_of_shared_mapping():
+    result = _run_in_subprocess("""
+        import gc
+        from python8.core.objects import SharedMapping, object_to_pickle, pickle_to_object
+
+        mapping = pickle_to_object(object_to_pickle(SharedMapping({"a": [1, 2]}), out_of_band=True))
+        assert dict(mapping) == {"a": [1, 2]}
+        del mapping
+        gc.collect()
+    """)
+    assert result.returncode == 0, result.stderr
+    assert "BufferError" not in result.stderr
@@ -0,0 +1,42 @@
+import pickle
+import sqlite3
+
+from python8.core.dictionaries import load_dict_from_sqlite, save_dict_to_sqlite, sync_dict_to_sqlite
+from python8.core.sqlite_dict import LazySQLiteDict
+
+
+def _table_names(file_path: str) -> set:
+    with sqlite3.connect(file_path) as connection:
+        return {name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+
+def test_sync_matches_non_string_keys(tmp_path):
+    file_path = str(tmp_path / "db.sqlite")
+    dictionary = {1: "a", 2.5: "b", 0.1: "c", 1e20: "d", "x": "e"}
+
+    assert save_dict_to_sqlite(file_path, dictionary)["inserted"] == list(dictionary)
+    assert save_dict_to_sqlite(file_path, dictionary)["unchanged"] == len(dictionary)
+
+    changes = sync_dict_to_sqlite(file_path, dictionary)
+    assert changes["inserted"] == changes["updated"] == changes["deleted"] == []
+
+
+def test_sync_detects_writes_made_without_sync(tmp_path):
+    file_path = str(tmp_path / "db.sqlite")
+    with LazySQLiteDict(file_path) as db:
+        db.sync({"a": 1, "b": 2})
+        db["a"] = 3
+        db.commit()
+        assert db.sync({"a": 1, "b": 2})["updated"] == ["a"]
+
+
+def test_reading_does_not_add_digest_table(tmp_path):
+    file_path = str(tmp_path / "db.sqlite")
+    with sqlite3.connect(file_path) as connection:
+        connection.execute("CREATE TABLE unnamed (key TEXT PRIMARY KEY, value BLOB)")
+        connection.execute("INSERT INTO unnamed VALUES (?, ?)", ("a", pickle.dumps(1)))
+
+    assert load_dict_from_sqlite(file_path) == {"a": 1}
+    with LazySQLiteDict(file_path) as db:
+        db["b"] = 2
+    assert _table_names(file_path) == {"unnamed"}